@@ -10,19 +10,30 @@ import logging
 import datetime
 import time
 import os
+import sys
+import io
+import re
 import asyncio
 import threading
+import weakref
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields, is_dataclass
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
 from typing import List, Dict, Optional, Tuple, Union
 from enum import Enum
-import boto3
-from azure.identity import DefaultAzureCredential
-from azure.mgmt.compute import ComputeManagementClient
-from azure.mgmt.resource import ResourceManagementClient
-from azure.core.exceptions import AzureError
 import requests
-import pandas as pd
+import numpy as np
+# Cloud SDKs and pandas are imported lazily where used to keep CLI startup fast
+
+# Optional fast JSON encoder for large inventory dumps
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -35,6 +46,145 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# /subscriptions/{sub}/resourceGroups/{rg}/providers/{namespace}/{type}/{name}
+_AZ_RG_VM_RE = re.compile(
+    r'/subscriptions/[^/]+/resourceGroups/(?P<rg>[^/]+)/providers/[^/]+/[^/]+/(?P<vm>[^/]+)',
+    re.IGNORECASE
+)
+
+# Simplified AWS instance metadata - in production, use AWS APIs
+_AWS_INSTANCE_TYPES = MappingProxyType({
+    't3.medium': (2, 4),
+    't3.large': (2, 8),
+    't3.xlarge': (4, 16),
+    'm5.large': (2, 8),
+    'm5.xlarge': (4, 16),
+    'm5.2xlarge': (8, 32),
+    'c5.large': (2, 4),
+    'c5.xlarge': (4, 8)
+})
+
+# Simplified AWS pricing - integrate with AWS Pricing API
+_AWS_BASE_COSTS = MappingProxyType({
+    't3.medium': 30.0,
+    't3.large': 60.0,
+    't3.xlarge': 120.0,
+    'm5.large': 70.0,
+    'm5.xlarge': 140.0,
+    'm5.2xlarge': 280.0
+})
+
+def _pooled_session(pool_size: int = 64) -> requests.Session:
+    """HTTP session whose keep-alive pool is shared by every Azure client using it"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    return session
+
+def _retry_after_seconds(headers, default: float = 5.0) -> float:
+    """Seconds to wait per a Retry-After header, which may be delta-seconds or an HTTP date"""
+    value = headers.get('Retry-After')
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+@lru_cache(maxsize=None)
+def _load_azure() -> SimpleNamespace:
+    """Import the Azure SDK on first use; runs that never build an Azure manager skip loading it"""
+    from azure.core.pipeline.transport import RequestsTransport
+    from azure.identity import DefaultAzureCredential
+    from azure.mgmt.compute import ComputeManagementClient
+    from azure.mgmt.resource import ResourceManagementClient, SubscriptionClient
+    
+    return SimpleNamespace(
+        RequestsTransport=RequestsTransport,
+        DefaultAzureCredential=DefaultAzureCredential,
+        ComputeManagementClient=ComputeManagementClient,
+        ResourceManagementClient=ResourceManagementClient,
+        SubscriptionClient=SubscriptionClient
+    )
+
+def _parse_vm_resource_id(vm_id: str) -> Tuple[str, str]:
+    """Extract (resource_group, vm_name) from an Azure VM resource ID"""
+    m = _AZ_RG_VM_RE.match(vm_id)
+    if not m:
+        raise ValueError(f"Invalid Azure VM resource ID: {vm_id}")
+    return m['rg'], m['vm']
+
+@lru_cache(maxsize=256)
+def _windows_edition(os_version: str) -> str:
+    """Windows edition for an OS version string; fleets repeat a handful of versions"""
+    if 'datacenter' in os_version.lower():
+        return 'Datacenter'
+    return 'Standard'
+
+def _risk_signature(vm: 'VMInfo') -> Tuple:
+    """Key of every VM attribute that feeds the risk score and its factor text"""
+    return (
+        vm.business_criticality,
+        vm.environment_type,
+        not vm.backup_frequency or vm.backup_frequency == 'none',
+        bool(vm.monitoring_enabled),
+        tuple(vm.compliance_requirements or ()),
+        len(vm.dependencies or ()),
+        bool(vm.performance_baseline)
+    )
+
+def _vm_cost_columns(vms: List['VMInfo']) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Materialize (current, byol, savings) monthly cost columns for a list of VMs"""
+    n = len(vms)
+    return (
+        np.fromiter((vm.monthly_cost_current for vm in vms), dtype=np.float64, count=n),
+        np.fromiter((vm.estimated_monthly_cost_byol for vm in vms), dtype=np.float64, count=n),
+        np.fromiter((vm.potential_savings for vm in vms), dtype=np.float64, count=n)
+    )
+
+def _aggregate_cost_columns(current: np.ndarray, byol: np.ndarray, savings: np.ndarray,
+                            license_codes: np.ndarray) -> Tuple[float, float, float, int, int]:
+    """Reduce cost columns to totals plus on-demand/BYOL counts"""
+    return (
+        float(current.sum()),
+        float(byol.sum()),
+        float(savings.sum()),
+        int(np.count_nonzero(license_codes == _LICENSE_CODES[LicenseType.ON_DEMAND])),
+        int(np.count_nonzero(license_codes == _LICENSE_CODES[LicenseType.BYOL]))
+    )
+
+# Classification sets and risk weights shared by the analysis engines
+_SCHEDULABLE_ENVS = frozenset({'development', 'testing', 'staging'})
+_LOW_RISK = frozenset({'low', 'very_low'})
+_RISK_TO_PHASE = MappingProxyType({
+    'very_low': 'phase_1_immediate',
+    'low': 'phase_1_immediate',
+    'medium': 'phase_2_short_term',
+    'high': 'phase_3_medium_term',
+    'critical': 'phase_4_long_term'
+})
+_CRITICALITY_SCORES = MappingProxyType({
+    'critical': 40,
+    'high': 25,
+    'medium': 15,
+    'low': 5,
+    'unknown': 20
+})
+_ENV_SCORES = MappingProxyType({
+    'production': 30,
+    'staging': 15,
+    'testing': 5,
+    'development': 0,
+    'unknown': 20
+})
+
 class RiskLevel(Enum):
     VERY_LOW = "very_low"
     LOW = "low"  
@@ -66,7 +216,34 @@ class LicenseType(Enum):
     BYOL = "byol"
     HYBRID_BENEFIT = "hybrid_benefit"
 
-@dataclass
+# Integer codes so license types can be reduced as plain int arrays
+_LICENSE_CODES = {license_type: code for code, license_type in enumerate(LicenseType)}
+
+def _json_default(obj):
+    """Serialize values JSON has no type for: dataclasses as dicts, enums by value, anything else as str"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    return obj.value if isinstance(obj, Enum) else str(obj)
+
+def _json_bytes(obj, indent: bool = False) -> bytes:
+    """UTF-8 JSON for report and log files; orjson when installed, else stdlib json
+    
+    Both encoders produce equivalent JSON, but not identical bytes: float spelling differs
+    (orjson 1e16 vs stdlib 1e+16) and orjson writes NaN/Infinity as null.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=_json_default, option=option)
+    if indent:
+        text = json.dumps(obj, default=_json_default, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, default=_json_default, separators=(',', ':'), ensure_ascii=False)
+    return text.encode('utf-8')
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+ only)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class WindowsLicense:
     license_key: str
     edition: str  # Standard, Datacenter, Core
@@ -89,7 +266,7 @@ class WindowsLicense:
     activation_count: int = 0
     max_activations: int = 1
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VMInfo:
     vm_id: str
     name: str
@@ -118,6 +295,10 @@ class VMInfo:
     dependencies: List[str] = None  # Other VMs/services this depends on
     performance_baseline: Dict = None  # CPU, memory, disk metrics
     conversion_readiness_score: float = 0.0  # 0-100 score
+    # Location, declared so the class can use __slots__
+    subscription_id: str = "unknown"
+    cloud_provider: str = "azure"
+    region: Optional[str] = None
 
 class LicenseManager:
     """Manages Windows license inventory and allocation"""
@@ -125,13 +306,15 @@ class LicenseManager:
     def __init__(self, license_file: str = "windows_licenses.json"):
         self.license_file = license_file
         self.licenses: List[WindowsLicense] = []
+        # Conversions allocate and release from worker threads; re-entrant for add_license -> save_licenses
+        self._lock = threading.RLock()
         self.load_licenses()
     
     def load_licenses(self):
         """Load license inventory from file"""
         try:
-            with open(self.license_file, 'r') as f:
-                data = json.load(f)
+            with open(self.license_file, 'rb') as f:
+                data = orjson.loads(f.read()) if ORJSON_AVAILABLE else json.load(f)
                 self.licenses = [WindowsLicense(**license) for license in data]
             logger.info(f"Loaded {len(self.licenses)} licenses from {self.license_file}")
         except FileNotFoundError:
@@ -144,16 +327,36 @@ class LicenseManager:
     def save_licenses(self):
         """Save license inventory to file"""
         try:
-            with open(self.license_file, 'w') as f:
-                json.dump([asdict(license) for license in self.licenses], f, indent=2)
+            # Encoded straight from the dataclasses, no per-license asdict() copy. Equivalent
+            # JSON to the old json.dump output, but non-ASCII is written as UTF-8 rather than
+            # \u escapes and orjson may spell floats differently (see _json_bytes)
+            with self._lock, open(self.license_file, 'wb') as f:
+                f.write(_json_bytes(self.licenses, indent=True))
             logger.info(f"Saved {len(self.licenses)} licenses to {self.license_file}")
         except Exception as e:
             logger.error(f"Error saving licenses: {e}")
     
+    def to_frame(self):
+        """Get the license inventory as a pandas DataFrame, one row per license"""
+        import pandas as pd
+        
+        return pd.DataFrame.from_records(
+            [asdict(license) for license in self.licenses],
+            columns=[field.name for field in fields(WindowsLicense)]
+        )
+    
+    def from_frame(self, df):
+        """Replace the license inventory with the rows of a DataFrame (see to_frame)"""
+        # Missing values come back as NaN from columnar formats; map them to None
+        records = df.astype(object).where(df.notna(), None).to_dict('records')
+        self.licenses = [WindowsLicense(**record) for record in records]
+        logger.info(f"Loaded {len(self.licenses)} licenses from DataFrame")
+    
     def add_license(self, license: WindowsLicense):
         """Add a license to the inventory"""
-        self.licenses.append(license)
-        self.save_licenses()
+        with self._lock:
+            self.licenses.append(license)
+            self.save_licenses()
         logger.info(f"Added license {license.license_key} to inventory")
     
     def get_available_licenses(self, edition: str, cores_needed: int) -> List[WindowsLicense]:
@@ -168,25 +371,27 @@ class LicenseManager:
     
     def allocate_license(self, vm_id: str, edition: str, cores_needed: int) -> Optional[WindowsLicense]:
         """Allocate a license to a VM"""
-        available_licenses = self.get_available_licenses(edition, cores_needed)
-        if available_licenses:
-            license = available_licenses[0]  # Take first available
-            license.in_use = True
-            license.assigned_vm = vm_id
-            self.save_licenses()
-            logger.info(f"Allocated license {license.license_key} to VM {vm_id}")
-            return license
+        with self._lock:
+            available_licenses = self.get_available_licenses(edition, cores_needed)
+            if available_licenses:
+                license = available_licenses[0]  # Take first available
+                license.in_use = True
+                license.assigned_vm = vm_id
+                self.save_licenses()
+                logger.info(f"Allocated license {license.license_key} to VM {vm_id}")
+                return license
         return None
     
     def release_license(self, vm_id: str):
         """Release license from a VM"""
-        for license in self.licenses:
-            if license.assigned_vm == vm_id:
-                license.in_use = False
-                license.assigned_vm = None
-                self.save_licenses()
-                logger.info(f"Released license {license.license_key} from VM {vm_id}")
-                break
+        with self._lock:
+            for license in self.licenses:
+                if license.assigned_vm == vm_id:
+                    license.in_use = False
+                    license.assigned_vm = None
+                    self.save_licenses()
+                    logger.info(f"Released license {license.license_key} from VM {vm_id}")
+                    break
 
 class CloudVMManager:
     """Base class for cloud VM management"""
@@ -217,12 +422,29 @@ class CloudVMManager:
 class AzureVMManager(CloudVMManager):
     """Azure-specific VM management"""
     
-    def __init__(self, subscription_id: str):
+    ARM_ENDPOINT = 'https://management.azure.com'
+    ARM_BATCH_URL = f'{ARM_ENDPOINT}/batch?api-version=2020-06-01'
+    ARM_BATCH_MAX_REQUESTS = 20  # ARM rejects batches larger than this
+    _TERMINAL_STATES = ('Succeeded', 'Failed', 'Canceled')
+    COMPUTE_API_VERSION = '2023-03-01'
+    
+    def __init__(self, subscription_id: str, credential=None, session: Optional[requests.Session] = None):
+        """Pass credential/session to share token cache and pooled connections across subscriptions"""
+        azure = _load_azure()
+        
         super().__init__(CloudProvider.AZURE)
         self.subscription_id = subscription_id
-        self.credential = DefaultAzureCredential()
-        self.compute_client = ComputeManagementClient(self.credential, subscription_id)
-        self.resource_client = ResourceManagementClient(self.credential, subscription_id)
+        self.credential = credential or azure.DefaultAzureCredential()
+        self.session = session or _pooled_session()
+        # Clients ride on the shared session; session_owner=False so closing one client leaves it open
+        self.compute_client = azure.ComputeManagementClient(
+            self.credential, subscription_id,
+            transport=azure.RequestsTransport(session=self.session, session_owner=False)
+        )
+        self.resource_client = azure.ResourceManagementClient(
+            self.credential, subscription_id,
+            transport=azure.RequestsTransport(session=self.session, session_owner=False)
+        )
         
         # Azure pricing (example rates - update with actual pricing)
         self.pricing = {
@@ -230,15 +452,47 @@ class AzureVMManager(CloudVMManager):
             'Standard_D4s_v3': {'on_demand': 192.72, 'byol': 96.36},
             'Standard_D8s_v3': {'on_demand': 385.44, 'byol': 192.72}
         }
+        
+        # Simplified size mapping - in production, use Azure pricing API
+        self.size_map = {
+            'Standard_D2s_v3': {'cores': 2, 'memory_gb': 8},
+            'Standard_D4s_v3': {'cores': 4, 'memory_gb': 16},
+            'Standard_D8s_v3': {'cores': 8, 'memory_gb': 32}
+        }
+        self._build_size_tables()
+    
+    def _build_size_tables(self):
+        """Precompute flat spec/pricing arrays indexed by VM size name"""
+        default_size = {'cores': 2, 'memory_gb': 4}
+        default_pricing = {'on_demand': 100, 'byol': 50}
+        
+        self._size_names = list(dict.fromkeys([*self.size_map, *self.pricing]))
+        self._size_idx = {name: i for i, name in enumerate(self._size_names)}
+        
+        # Trailing slot holds the defaults, so unknown sizes resolve through index -1
+        sizes = [self.size_map.get(name, default_size) for name in self._size_names] + [default_size]
+        prices = [self.pricing.get(name, default_pricing) for name in self._size_names] + [default_pricing]
+        self._cores = np.array([size['cores'] for size in sizes], dtype=np.int32)
+        self._mem = np.array([size['memory_gb'] for size in sizes], dtype=np.float64)
+        self._od = np.array([price['on_demand'] for price in prices], dtype=np.float64)
+        self._byol = np.array([price['byol'] for price in prices], dtype=np.float64)
+    
+    def _lookup_size_specs(self, vm_sizes: List[str]) -> List[Tuple[int, float, float, float]]:
+        """Resolve (cores, memory_gb, on_demand, byol) for many VM sizes in one gather"""
+        indices = np.fromiter((self._size_idx.get(size, -1) for size in vm_sizes),
+                              dtype=np.int32, count=len(vm_sizes))
+        return list(zip(self._cores[indices].tolist(), self._mem[indices].tolist(),
+                        self._od[indices].tolist(), self._byol[indices].tolist()))
     
     def discover_vms(self) -> List[VMInfo]:
         """Discover Windows VMs in Azure"""
         vms = []
         try:
-            for vm in self.compute_client.virtual_machines.list_all():
-                if self._is_windows_vm(vm):
-                    vm_info = self._create_vm_info(vm)
-                    vms.append(vm_info)
+            windows_vms = [vm for vm in self.compute_client.virtual_machines.list_all() if self._is_windows_vm(vm)]
+            size_specs = self._lookup_size_specs([vm.hardware_profile.vm_size for vm in windows_vms])
+            now_iso = datetime.datetime.now().isoformat()
+            for vm, specs in zip(windows_vms, size_specs):
+                vms.append(self._create_vm_info(vm, now_iso, specs))
             logger.info(f"Discovered {len(vms)} Windows VMs in Azure")
         except Exception as e:
             logger.error(f"Error discovering Azure VMs: {e}")
@@ -250,10 +504,13 @@ class AzureVMManager(CloudVMManager):
             return vm.storage_profile.os_disk.os_type.lower() == 'windows'
         return False
     
-    def _create_vm_info(self, vm) -> VMInfo:
+    def _create_vm_info(self, vm, now_iso: str,
+                        size_specs: Optional[Tuple[int, float, float, float]] = None) -> VMInfo:
         """Create VMInfo object from Azure VM"""
-        # Extract VM size info
-        size_info = self._get_vm_size_info(vm.hardware_profile.vm_size)
+        # Extract VM size info and costs (pre-resolved in bulk during discovery)
+        if size_specs is None:
+            size_specs = self._lookup_size_specs([vm.hardware_profile.vm_size])[0]
+        cores, memory_gb, current_cost, byol_cost = size_specs
         
         # Determine current license type
         current_license = LicenseType.ON_DEMAND
@@ -261,16 +518,13 @@ class AzureVMManager(CloudVMManager):
             if vm.license_type.lower() == 'windows_server':
                 current_license = LicenseType.HYBRID_BENEFIT
         
-        # Calculate costs
-        current_cost, byol_cost = self.get_vm_cost_by_size(vm.hardware_profile.vm_size)
-        
         return VMInfo(
             vm_id=vm.id,
             name=vm.name,
-            resource_group=vm.id.split('/')[4],  # Extract from resource ID
+            resource_group=_parse_vm_resource_id(vm.id)[0],  # Extract from resource ID
             size=vm.hardware_profile.vm_size,
-            cores=size_info['cores'],
-            memory_gb=size_info['memory_gb'],
+            cores=cores,
+            memory_gb=memory_gb,
             os_version=self._get_os_version(vm),
             current_license_type=current_license,
             status=VMStatus.RUNNING if vm.instance_view and vm.instance_view.statuses else VMStatus.STOPPED,
@@ -278,18 +532,15 @@ class AzureVMManager(CloudVMManager):
             estimated_monthly_cost_byol=byol_cost,
             potential_savings=current_cost - byol_cost,
             risk_level=self._assess_risk_level(vm),
-            last_updated=datetime.datetime.now().isoformat()
+            last_updated=now_iso,
+            subscription_id=self.subscription_id,
+            region=getattr(vm, 'location', None)
         )
     
     def _get_vm_size_info(self, vm_size: str) -> Dict:
         """Get VM size information"""
-        # Simplified mapping - in production, use Azure pricing API
-        size_map = {
-            'Standard_D2s_v3': {'cores': 2, 'memory_gb': 8},
-            'Standard_D4s_v3': {'cores': 4, 'memory_gb': 16},
-            'Standard_D8s_v3': {'cores': 8, 'memory_gb': 32}
-        }
-        return size_map.get(vm_size, {'cores': 2, 'memory_gb': 4})
+        i = self._size_idx.get(vm_size, -1)
+        return {'cores': int(self._cores[i]), 'memory_gb': float(self._mem[i])}
     
     def _get_os_version(self, vm) -> str:
         """Extract Windows OS version"""
@@ -312,42 +563,154 @@ class AzureVMManager(CloudVMManager):
     
     def get_vm_cost_by_size(self, vm_size: str) -> Tuple[float, float]:
         """Get current and BYOL costs for VM size"""
-        pricing = self.pricing.get(vm_size, {'on_demand': 100, 'byol': 50})
-        return pricing['on_demand'], pricing['byol']
+        i = self._size_idx.get(vm_size, -1)
+        return float(self._od[i]), float(self._byol[i])
+    
+    def begin_convert_to_byol(self, vm_id: str):
+        """Start the BYOL (Hybrid Benefit) update and return the poller without waiting"""
+        # Parse resource group and VM name from ID
+        resource_group, vm_name = _parse_vm_resource_id(vm_id)
+        
+        # Get VM
+        vm = self.compute_client.virtual_machines.get(resource_group, vm_name)
+        
+        # Update license type
+        vm.license_type = 'Windows_Server'
+        
+        # Apply update
+        return self.compute_client.virtual_machines.begin_create_or_update(
+            resource_group, vm_name, vm
+        )
     
     def convert_to_byol(self, vm_id: str) -> bool:
         """Convert Azure VM to BYOL (Hybrid Benefit)"""
         try:
-            # Parse resource group and VM name from ID
-            parts = vm_id.split('/')
-            resource_group = parts[4]
-            vm_name = parts[8]
-            
-            # Get VM
-            vm = self.compute_client.virtual_machines.get(resource_group, vm_name)
-            
-            # Update license type
-            vm.license_type = 'Windows_Server'
-            
-            # Apply update
-            operation = self.compute_client.virtual_machines.begin_create_or_update(
-                resource_group, vm_name, vm
-            )
+            operation = self.begin_convert_to_byol(vm_id)
             operation.result()  # Wait for completion
             
-            logger.info(f"Successfully converted VM {vm_name} to BYOL")
+            logger.info(f"Successfully converted VM {vm_id} to BYOL")
             return True
             
         except Exception as e:
             logger.error(f"Error converting VM {vm_id} to BYOL: {e}")
             return False
     
+    def convert_to_byol_batch(self, vm_ids: List[str], timeout: int = 600) -> List[Dict]:
+        """Convert up to ARM_BATCH_MAX_REQUESTS VMs to BYOL with a single ARM batch request
+        
+        Each VM is a PATCH of its licenseType, so no prior GET is needed. Returns one
+        result dict per VM in input order. 'accepted' means ARM took the update (2xx);
+        'success' is only set once the update has finished (see _track_update).
+        """
+        if len(vm_ids) > self.ARM_BATCH_MAX_REQUESTS:
+            raise ValueError(f"ARM batch supports at most {self.ARM_BATCH_MAX_REQUESTS} requests, got {len(vm_ids)}")
+        
+        token = self.credential.get_token('https://management.azure.com/.default').token
+        headers = {'Authorization': f'Bearer {token}'}
+        body = {'requests': [
+            {
+                'httpMethod': 'PATCH',
+                'name': str(i),
+                'url': f"{vm_id}?api-version={self.COMPUTE_API_VERSION}",
+                'content': {'properties': {'licenseType': 'Windows_Server'}}
+            }
+            for i, vm_id in enumerate(vm_ids)
+        ]}
+        
+        response = self.session.post(self.ARM_BATCH_URL, json=body, headers=headers, timeout=60)
+        
+        # ARM may process the batch asynchronously; poll Location until the responses are ready
+        deadline = time.monotonic() + timeout
+        while response.status_code == 202:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Batch conversion did not complete within {timeout}s")
+            time.sleep(_retry_after_seconds(response.headers))
+            response = self.session.get(response.headers['Location'], headers=headers, timeout=60)
+        response.raise_for_status()
+        
+        responses = response.json().get('responses', [])
+        by_name = {item.get('name', str(i)): item for i, item in enumerate(responses)}
+        
+        results = []
+        pending = {}  # result index -> update tracker for items ARM is still applying
+        for i, vm_id in enumerate(vm_ids):
+            item = by_name.get(str(i), {})
+            status_code = item.get('httpStatusCode', 0)
+            result = {'vm_id': vm_id, 'success': False, 'accepted': 200 <= status_code < 300}
+            results.append(result)
+            if result['accepted']:
+                pending[i] = self._track_update(vm_id, item)
+            else:
+                result['error'] = ((item.get('content') or {}).get('error') or {}).get('message') or f"HTTP {status_code}"
+        
+        # Follow every accepted update in one loop, so the batch sleeps once per round rather than once per VM
+        while pending:
+            for i in [i for i, tracker in pending.items() if tracker['state'] in self._TERMINAL_STATES]:
+                tracker = pending.pop(i)
+                results[i]['success'] = tracker['state'] == 'Succeeded'
+                if not results[i]['success']:
+                    results[i]['error'] = tracker['error'] or f"Update {tracker['state'].lower()}"
+            if not pending:
+                break
+            if time.monotonic() > deadline:
+                for i in pending:
+                    results[i]['error'] = "Update accepted but still in progress at timeout"
+                break
+            time.sleep(min(_retry_after_seconds(tracker['wait_headers']) for tracker in pending.values()))
+            for tracker in pending.values():
+                self._poll_update(tracker, headers)
+        
+        return results
+    
+    def _track_update(self, vm_id: str, item: Dict) -> Dict:
+        """Polling state for one accepted batch item
+        
+        202 items are followed through their Azure-AsyncOperation or Location header; 200 items
+        report provisioningState, and the VM itself is polled while that is still 'Updating'.
+        """
+        item_headers = {key.lower(): value for key, value in (item.get('headers') or {}).items()}
+        if 'azure-asyncoperation' in item_headers:
+            # Operation status resource: {"status": "InProgress" | "Succeeded" | "Failed" | "Canceled"}
+            url, state_of = item_headers['azure-asyncoperation'], lambda status_code, body: body.get('status')
+        elif 'location' in item_headers:
+            # Location answers 202 until the operation ends
+            url, state_of = item_headers['location'], lambda status_code, body: None if status_code == 202 else 'Succeeded'
+        else:
+            url = f"{self.ARM_ENDPOINT}{vm_id}?api-version={self.COMPUTE_API_VERSION}"
+            state_of = lambda status_code, body: (body.get('properties') or {}).get('provisioningState')
+        
+        # A 202 item carries no final state yet; a 200 item carries the VM and its provisioningState
+        content = item.get('content') or {}
+        state = None if item.get('httpStatusCode') == 202 else (content.get('properties') or {}).get('provisioningState')
+        return {
+            'url': url,
+            'state_of': state_of,
+            'state': state,
+            'error': None,
+            'wait_headers': {'Retry-After': item_headers.get('retry-after')}
+        }
+    
+    def _poll_update(self, tracker: Dict, headers: Dict):
+        """Poll one tracked update once; a request or parse error fails only that VM"""
+        try:
+            response = self.session.get(tracker['url'], headers=headers, timeout=60)
+            body = response.json() if response.content else {}
+        except Exception as e:
+            tracker['state'], tracker['error'] = 'Failed', str(e)
+            return
+        tracker['wait_headers'] = response.headers
+        if not 200 <= response.status_code < 300:
+            tracker['state'] = 'Failed'
+            tracker['error'] = (body.get('error') or {}).get('message') or f"HTTP {response.status_code}"
+            return
+        tracker['state'] = tracker['state_of'](response.status_code, body)
+        if tracker['state'] in ('Failed', 'Canceled'):
+            tracker['error'] = (body.get('error') or {}).get('message')
+    
     def create_snapshot(self, vm_id: str) -> str:
         """Create snapshot of VM's OS disk"""
         try:
-            parts = vm_id.split('/')
-            resource_group = parts[4]
-            vm_name = parts[8]
+            resource_group, vm_name = _parse_vm_resource_id(vm_id)
             
             # Get VM to find OS disk
             vm = self.compute_client.virtual_machines.get(resource_group, vm_name)
@@ -368,21 +731,75 @@ class AWSVMManager(CloudVMManager):
     """Enhanced AWS VM management with advanced BYOL support"""
     
     def __init__(self, region: str = 'us-east-1'):
+        import boto3
+        from botocore.config import Config as BotoConfig
+        
         super().__init__(CloudProvider.AWS)
         self.session = boto3.Session()
-        self.ec2_client = self.session.client('ec2', region_name=region)
-        self.pricing_client = self.session.client('pricing', region_name='us-east-1')
-        self.cloudwatch = self.session.client('cloudwatch', region_name=region)
-        
+        # Larger pool so concurrent calls to one region don't serialize on the default of 10
+        self._boto_config = BotoConfig(
+            max_pool_connections=64,
+            retries={'max_attempts': 10, 'mode': 'adaptive'}
+        )
+        self._clients: Dict[Tuple[str, str], object] = {}
+        self._clients_lock = threading.Lock()
+        self.ec2_client = self._get_client('ec2', region)
+        self.pricing_client = self._get_client('pricing', 'us-east-1')
+        self.cloudwatch = self._get_client('cloudwatch', region)
+        
+        # Region list is effectively static for a run; fetched once on first discovery
+        self._regions: Optional[List[str]] = None
+        self._build_instance_tables()
+    
+    def _get_client(self, service: str, region: str):
+        """Get a shared boto3 client for (service, region), creating it on first use"""
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            # Client creation from a shared session is not thread-safe
+            with self._clients_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self.session.client(service, region_name=region, config=self._boto_config)
+                    self._clients[key] = client
+        return client
+    
+    def _build_instance_tables(self):
+        """Precompute flat spec/pricing arrays indexed by instance type name"""
+        self._type_names = list(dict.fromkeys([*_AWS_INSTANCE_TYPES, *_AWS_BASE_COSTS]))
+        self._type_idx = {name: i for i, name in enumerate(self._type_names)}
+        
+        # Trailing slot holds the defaults, so unknown types resolve through index -1
+        specs = [_AWS_INSTANCE_TYPES.get(name, (2, 4)) for name in self._type_names] + [(2, 4)]
+        self._cores = np.array([cores for cores, _ in specs], dtype=np.int32)
+        self._mem = np.array([memory_gb for _, memory_gb in specs], dtype=np.float64)
+        self._od = np.array([_AWS_BASE_COSTS.get(name, 50.0) for name in self._type_names] + [50.0],
+                            dtype=np.float64)
+        self._byol = self._od * 0.6  # Approximate 40% savings with BYOL
+    
+    def _lookup_instance_specs(self, instance_types: List[str]) -> List[Tuple[int, float, float, float]]:
+        """Resolve (cores, memory_gb, on_demand, byol) for many instance types in one gather"""
+        indices = np.fromiter((self._type_idx.get(t, -1) for t in instance_types),
+                              dtype=np.int32, count=len(instance_types))
+        return list(zip(self._cores[indices].tolist(), self._mem[indices].tolist(),
+                        self._od[indices].tolist(), self._byol[indices].tolist()))
+    
+    def _get_regions(self) -> List[str]:
+        """Get the list of available AWS regions, cached after the first call"""
+        if self._regions is None:
+            self._regions = [region['RegionName'] for region in self.ec2_client.describe_regions()['Regions']]
+        return self._regions
+    
     def discover_vms(self) -> List[VMInfo]:
         """Discover Windows VMs across all AWS regions"""
         vms = []
         try:
-            regions = [region['RegionName'] for region in self.ec2_client.describe_regions()['Regions']]
+            regions = self._get_regions()
+            now_iso = datetime.datetime.now().isoformat()
             
             for region in regions:
                 try:
-                    regional_ec2 = self.session.client('ec2', region_name=region)
+                    regional_ec2 = self._get_client('ec2', region)
                     response = regional_ec2.describe_instances(
                         Filters=[
                             {'Name': 'platform', 'Values': ['windows']},
@@ -390,10 +807,12 @@ class AWSVMManager(CloudVMManager):
                         ]
                     )
                     
-                    for reservation in response['Reservations']:
-                        for instance in reservation['Instances']:
-                            vm_info = self._create_vm_info_from_instance(instance, region)
-                            vms.append(vm_info)
+                    instances = [instance for reservation in response['Reservations']
+                                 for instance in reservation['Instances']]
+                    instance_specs = self._lookup_instance_specs([i['InstanceType'] for i in instances])
+                    for instance, specs in zip(instances, instance_specs):
+                        vm_info = self._create_vm_info_from_instance(instance, region, now_iso, specs)
+                        vms.append(vm_info)
                             
                 except Exception as e:
                     logger.warning(f"Error discovering VMs in region {region}: {e}")
@@ -403,20 +822,20 @@ class AWSVMManager(CloudVMManager):
             logger.error(f"Error discovering AWS VMs: {e}")
         return vms
     
-    def _create_vm_info_from_instance(self, instance: Dict, region: str) -> VMInfo:
+    def _create_vm_info_from_instance(self, instance: Dict, region: str, now_iso: str,
+                                      instance_specs: Optional[Tuple[int, float, float, float]] = None) -> VMInfo:
         """Create VMInfo object from AWS EC2 instance"""
         instance_type = instance['InstanceType']
         
-        # Get instance type info
-        cores, memory_gb = self._get_instance_type_info(instance_type)
+        # Get instance type info and costs (pre-resolved in bulk during discovery)
+        if instance_specs is None:
+            instance_specs = self._lookup_instance_specs([instance_type])[0]
+        cores, memory_gb, current_cost, byol_cost = instance_specs
         
         # Determine license type
         current_license = LicenseType.ON_DEMAND
         if instance.get('UsageOperation', '').startswith('RunInstances:'):
             current_license = LicenseType.BYOL
-            
-        # Calculate costs
-        current_cost, byol_cost = self._get_instance_costs(instance_type, region)
         
         return VMInfo(
             vm_id=instance['InstanceId'],
@@ -432,39 +851,20 @@ class AWSVMManager(CloudVMManager):
             estimated_monthly_cost_byol=byol_cost,
             potential_savings=current_cost - byol_cost,
             risk_level=self._assess_aws_risk(instance),
-            last_updated=datetime.datetime.now().isoformat(),
+            last_updated=now_iso,
+            cloud_provider="aws",
             region=region
         )
     
     def _get_instance_type_info(self, instance_type: str) -> Tuple[int, float]:
         """Get core and memory info for AWS instance type"""
-        # Simplified mapping - in production, use AWS APIs
-        type_map = {
-            't3.medium': (2, 4),
-            't3.large': (2, 8),
-            't3.xlarge': (4, 16),
-            'm5.large': (2, 8),
-            'm5.xlarge': (4, 16),
-            'm5.2xlarge': (8, 32),
-            'c5.large': (2, 4),
-            'c5.xlarge': (4, 8)
-        }
-        return type_map.get(instance_type, (2, 4))
+        i = self._type_idx.get(instance_type, -1)
+        return int(self._cores[i]), float(self._mem[i])
     
     def _get_instance_costs(self, instance_type: str, region: str) -> Tuple[float, float]:
         """Get on-demand and BYOL costs for instance type"""
-        # Simplified pricing - integrate with AWS Pricing API
-        base_costs = {
-            't3.medium': 30.0,
-            't3.large': 60.0,
-            't3.xlarge': 120.0,
-            'm5.large': 70.0,
-            'm5.xlarge': 140.0,
-            'm5.2xlarge': 280.0
-        }
-        on_demand = base_costs.get(instance_type, 50.0)
-        byol = on_demand * 0.6  # Approximate 40% savings with BYOL
-        return on_demand, byol
+        i = self._type_idx.get(instance_type, -1)
+        return float(self._od[i]), float(self._byol[i])
     
     def _get_windows_version(self, instance: Dict) -> str:
         """Extract Windows version from instance"""
@@ -503,7 +903,9 @@ class MultiSubscriptionAzureManager:
     """Enhanced Azure VM manager supporting multiple subscriptions simultaneously"""
     
     def __init__(self, subscription_ids: List[str] = None):
-        self.credential = DefaultAzureCredential()
+        self.credential = _load_azure().DefaultAzureCredential()
+        # One credential and connection pool for every subscription's clients
+        self.session = _pooled_session()
         self.managers = {}
         
         # If no subscription IDs provided, discover all accessible subscriptions
@@ -517,7 +919,7 @@ class MultiSubscriptionAzureManager:
         # Initialize manager for each subscription
         for sub_id in self.subscription_ids:
             try:
-                self.managers[sub_id] = AzureVMManager(sub_id)
+                self.managers[sub_id] = AzureVMManager(sub_id, credential=self.credential, session=self.session)
                 logger.info(f"✅ Initialized Azure manager for subscription: {sub_id}")
             except Exception as e:
                 logger.error(f"❌ Failed to initialize manager for subscription {sub_id}: {e}")
@@ -527,10 +929,8 @@ class MultiSubscriptionAzureManager:
         subscription_ids = []
         
         try:
-            from azure.mgmt.resource import SubscriptionClient
-            
             # Create subscription client
-            subscription_client = SubscriptionClient(self.credential)
+            subscription_client = _load_azure().SubscriptionClient(self.credential)
             
             # Get all accessible subscriptions
             subscriptions = subscription_client.subscriptions.list()
@@ -566,33 +966,43 @@ class MultiSubscriptionAzureManager:
         
         return subscription_ids
     
-    def discover_all_subscriptions_vms(self) -> Dict[str, List[VMInfo]]:
-        """Discover VMs across all configured Azure subscriptions"""
-        all_vms = {}
+    def discover_all_subscriptions_vms(self, max_workers: int = 16) -> Dict[str, List[VMInfo]]:
+        """Discover VMs across all configured Azure subscriptions
+        
+        Subscriptions are independent I/O-bound scans, so they run concurrently;
+        results keep subscription order.
+        """
+        discovered = {}
         total_vms = 0
         
         logger.info(f"🔍 Discovering VMs across {len(self.subscription_ids)} Azure subscriptions...")
         
-        for sub_id, manager in self.managers.items():
-            try:
-                logger.info(f"📊 Scanning subscription: {sub_id}")
-                vms = manager.discover_vms()
-                
-                # Add subscription info to each VM
-                for vm in vms:
-                    vm.subscription_id = sub_id
-                    vm.cloud_provider = "azure"
-                
-                all_vms[sub_id] = vms
-                total_vms += len(vms)
-                logger.info(f"  └─ Found {len(vms)} Windows VMs in {sub_id}")
-                
-            except Exception as e:
-                logger.error(f"❌ Error discovering VMs in subscription {sub_id}: {e}")
-                all_vms[sub_id] = []
+        if self.managers:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(self.managers))) as executor:
+                futures = {}
+                for sub_id, manager in self.managers.items():
+                    logger.info(f"📊 Scanning subscription: {sub_id}")
+                    futures[executor.submit(manager.discover_vms)] = sub_id
+                for future in as_completed(futures):
+                    sub_id = futures[future]
+                    try:
+                        vms = future.result()
+                        
+                        # Add subscription info to each VM
+                        for vm in vms:
+                            vm.subscription_id = sub_id
+                            vm.cloud_provider = "azure"
+                        
+                        discovered[sub_id] = vms
+                        total_vms += len(vms)
+                        logger.info(f"  └─ Found {len(vms)} Windows VMs in {sub_id}")
+                        
+                    except Exception as e:
+                        logger.error(f"❌ Error discovering VMs in subscription {sub_id}: {e}")
+                        discovered[sub_id] = []
         
         logger.info(f"🎯 Total discovery complete: {total_vms} VMs across {len(self.subscription_ids)} subscriptions")
-        return all_vms
+        return {sub_id: discovered[sub_id] for sub_id in self.managers}
     
     def get_consolidated_vm_list(self) -> List[VMInfo]:
         """Get a single consolidated list of all VMs across subscriptions"""
@@ -608,9 +1018,14 @@ class MultiSubscriptionAzureManager:
         """Compatibility method for single-manager interface"""
         return self.get_consolidated_vm_list()
     
-    def get_subscription_summary(self) -> Dict:
-        """Get summary statistics for each subscription"""
-        all_vms = self.discover_all_subscriptions_vms()
+    def get_subscription_summary(self, all_vms: Optional[Dict[str, List[VMInfo]]] = None) -> Dict:
+        """Get summary statistics for each subscription
+        
+        Args:
+            all_vms: Previously discovered VMs by subscription; discovered when omitted
+        """
+        if all_vms is None:
+            all_vms = self.discover_all_subscriptions_vms()
         summary = {
             'total_subscriptions': len(self.subscription_ids),
             'subscription_details': {},
@@ -625,17 +1040,7 @@ class MultiSubscriptionAzureManager:
         }
         
         for sub_id, vms in all_vms.items():
-            sub_summary = {
-                'subscription_id': sub_id,
-                'vm_count': len(vms),
-                'current_monthly_cost': sum(vm.monthly_cost_current for vm in vms),
-                'byol_monthly_cost': sum(vm.estimated_monthly_cost_byol for vm in vms),
-                'potential_monthly_savings': sum(vm.potential_savings for vm in vms),
-                'on_demand_count': len([vm for vm in vms if vm.current_license_type == LicenseType.ON_DEMAND]),
-                'byol_count': len([vm for vm in vms if vm.current_license_type == LicenseType.BYOL]),
-                'risk_breakdown': self._get_risk_breakdown(vms),
-                'environment_breakdown': self._get_environment_breakdown(vms)
-            }
+            sub_summary = self._summarize_subscription(sub_id, vms)
             
             summary['subscription_details'][sub_id] = sub_summary
             
@@ -649,29 +1054,45 @@ class MultiSubscriptionAzureManager:
         
         return summary
     
-    def _get_risk_breakdown(self, vms: List[VMInfo]) -> Dict[str, int]:
-        """Get risk level breakdown for VMs"""
-        breakdown = {}
+    def _summarize_subscription(self, sub_id: str, vms: List[VMInfo]) -> Dict:
+        """Get summary statistics for one subscription from columnar cost arrays"""
+        current, byol, savings = _vm_cost_columns(vms)
+        license_codes = np.fromiter((_LICENSE_CODES[vm.current_license_type] for vm in vms),
+                                    dtype=np.int8, count=len(vms))
+        current_cost, byol_cost, total_savings, on_demand_count, byol_count = _aggregate_cost_columns(
+            current, byol, savings, license_codes
+        )
+        
+        risk_breakdown: Dict[str, int] = {}
+        environment_breakdown: Dict[str, int] = {}
         for vm in vms:
             risk = vm.risk_level
-            breakdown[risk] = breakdown.get(risk, 0) + 1
-        return breakdown
-    
-    def _get_environment_breakdown(self, vms: List[VMInfo]) -> Dict[str, int]:
-        """Get environment type breakdown for VMs"""
-        breakdown = {}
-        for vm in vms:
+            risk_breakdown[risk] = risk_breakdown.get(risk, 0) + 1
             env = vm.environment_type
-            breakdown[env] = breakdown.get(env, 0) + 1
-        return breakdown
+            environment_breakdown[env] = environment_breakdown.get(env, 0) + 1
+        
+        return {
+            'subscription_id': sub_id,
+            'vm_count': len(vms),
+            'current_monthly_cost': current_cost,
+            'byol_monthly_cost': byol_cost,
+            'potential_monthly_savings': total_savings,
+            'on_demand_count': on_demand_count,
+            'byol_count': byol_count,
+            'risk_breakdown': risk_breakdown,
+            'environment_breakdown': environment_breakdown
+        }
     
     def convert_vms_across_subscriptions(self, conversion_plan: Dict[str, List[str]], 
-                                       dry_run: bool = True) -> Dict:
+                                       dry_run: bool = True,
+                                       all_vms: Optional[Dict[str, List[VMInfo]]] = None) -> Dict:
         """Convert VMs across multiple subscriptions according to plan
         
         Args:
             conversion_plan: Dict with subscription_id as key and list of VM IDs as value
             dry_run: Whether to simulate the conversion
+            all_vms: Previously discovered VMs by subscription, used to credit each live
+                conversion with its potential savings; discovered when omitted
         
         Returns:
             Dict with conversion results per subscription
@@ -688,6 +1109,9 @@ class MultiSubscriptionAzureManager:
         
         logger.info(f"🚀 {'Simulating' if dry_run else 'Starting'} multi-subscription BYOL conversion...")
         
+        total_attempted = total_successful = total_failed = 0
+        total_savings = 0
+        
         for sub_id, vm_ids in conversion_plan.items():
             if sub_id not in self.managers:
                 logger.error(f"❌ No manager found for subscription {sub_id}")
@@ -695,60 +1119,58 @@ class MultiSubscriptionAzureManager:
             
             logger.info(f"📋 Processing {len(vm_ids)} VMs in subscription {sub_id}")
             manager = self.managers[sub_id]
-            sub_results = {
-                'subscription_id': sub_id,
-                'vm_conversions': [],
-                'successful_count': 0,
-                'failed_count': 0,
-                'monthly_savings': 0
-            }
             
-            for vm_id in vm_ids:
-                try:
-                    if dry_run:
-                        # Simulate conversion
-                        conversion_result = {
-                            'vm_id': vm_id,
-                            'subscription_id': sub_id,
-                            'success': True,  # Assume success in simulation
-                            'dry_run': True,
-                            'simulated_savings': 100,  # Mock savings
-                            'timestamp': datetime.datetime.now().isoformat()
-                        }
-                        logger.info(f"🔍 DRY RUN: Would convert VM {vm_id} in {sub_id}")
-                    else:
-                        # Actual conversion
-                        conversion_result = manager.convert_to_byol(vm_id)
-                        conversion_result['subscription_id'] = sub_id
-                        conversion_result['timestamp'] = datetime.datetime.now().isoformat()
-                    
-                    sub_results['vm_conversions'].append(conversion_result)
-                    
-                    if conversion_result.get('success', False):
-                        sub_results['successful_count'] += 1
-                        sub_results['monthly_savings'] += conversion_result.get('simulated_savings', 0)
-                    else:
-                        sub_results['failed_count'] += 1
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error converting VM {vm_id} in {sub_id}: {e}")
-                    sub_results['vm_conversions'].append({
+            if dry_run:
+                conversions = [None] * len(vm_ids)
+                # Simulated conversions share one instant, so format the timestamp once
+                timestamp = datetime.datetime.now().isoformat()
+                for i, vm_id in enumerate(vm_ids):
+                    # Simulate conversion
+                    conversions[i] = {
                         'vm_id': vm_id,
                         'subscription_id': sub_id,
-                        'success': False,
-                        'error': str(e),
-                        'timestamp': datetime.datetime.now().isoformat()
-                    })
-                    sub_results['failed_count'] += 1
+                        'success': True,  # Assume success in simulation
+                        'dry_run': True,
+                        'simulated_savings': 100,  # Mock savings
+                        'timestamp': timestamp
+                    }
+                    logger.info(f"🔍 DRY RUN: Would convert VM {vm_id} in {sub_id}")
+            else:
+                # Actual conversion
+                if all_vms is None:
+                    all_vms = self.discover_all_subscriptions_vms()
+                vm_savings = {vm.vm_id: vm.potential_savings for vm in all_vms.get(sub_id, [])}
+                conversions = self._convert_subscription_vms(manager, sub_id, vm_ids)
+                for conversion_result in conversions:
+                    conversion_result['monthly_savings'] = vm_savings.get(conversion_result['vm_id'], 0)
             
-            results['subscription_results'][sub_id] = sub_results
-            results['total_conversions_attempted'] += len(vm_ids)
-            results['total_successful'] += sub_results['successful_count']
-            results['total_failed'] += sub_results['failed_count']
-            results['total_monthly_savings'] += sub_results['monthly_savings']
+            successful = failed = 0
+            savings = 0
+            for conversion_result in conversions:
+                if conversion_result.get('success', False):
+                    successful += 1
+                    savings += conversion_result.get('simulated_savings', conversion_result.get('monthly_savings', 0))
+                else:
+                    failed += 1
+            
+            results['subscription_results'][sub_id] = {
+                'subscription_id': sub_id,
+                'vm_conversions': conversions,
+                'successful_count': successful,
+                'failed_count': failed,
+                'monthly_savings': savings
+            }
+            total_attempted += len(vm_ids)
+            total_successful += successful
+            total_failed += failed
+            total_savings += savings
             
-            logger.info(f"✅ Subscription {sub_id}: {sub_results['successful_count']}/{len(vm_ids)} successful")
+            logger.info(f"✅ Subscription {sub_id}: {successful}/{len(vm_ids)} successful")
         
+        results['total_conversions_attempted'] = total_attempted
+        results['total_successful'] = total_successful
+        results['total_failed'] = total_failed
+        results['total_monthly_savings'] = total_savings
         results['end_time'] = datetime.datetime.now().isoformat()
         results['success_rate'] = (results['total_successful'] / results['total_conversions_attempted'] * 100) if results['total_conversions_attempted'] > 0 else 0
         
@@ -757,45 +1179,114 @@ class MultiSubscriptionAzureManager:
         logger.info(f"   Savings: ${results['total_monthly_savings']:,.2f}/month")
         
         return results
+    
+    def _convert_subscription_vms(self, manager: AzureVMManager, sub_id: str, vm_ids: List[str],
+                                  max_in_flight: int = 8, timeout: int = 600) -> List[Dict]:
+        """Convert VMs in one subscription through ARM batch requests, keeping at most max_in_flight batches outstanding
+        
+        Each batch carries up to ARM_BATCH_MAX_REQUESTS updates and runs on a worker thread.
+        """
+        batch_size = manager.ARM_BATCH_MAX_REQUESTS
+        batches = [vm_ids[i:i + batch_size] for i in range(0, len(vm_ids), batch_size)]
+        
+        def convert_batch(batch: List[str]) -> List[Dict]:
+            try:
+                outcome = manager.convert_to_byol_batch(batch, timeout)
+            except Exception as e:
+                logger.error(f"❌ Error converting batch of {len(batch)} VMs in {sub_id}: {e}")
+                outcome = [{'vm_id': vm_id, 'success': False, 'error': str(e)} for vm_id in batch]
+            # Stamp the batch when it completes, not when the whole subscription does
+            timestamp = datetime.datetime.now().isoformat()
+            for result in outcome:
+                result['subscription_id'] = sub_id
+                result['timestamp'] = timestamp
+            return outcome
+        
+        # The pool size is the in-flight limit that keeps us under ARM throttling
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            outcomes = list(executor.map(convert_batch, batches))
+        
+        conversions = []
+        for outcome in outcomes:
+            for result in outcome:
+                if not result['success']:
+                    logger.error(f"❌ Error converting VM {result['vm_id']} in {sub_id}: {result['error']}")
+                conversions.append(result)
+        
+        return conversions
 
 
 class MultiCloudVMManager:
     """Unified multi-cloud VM management for BYOL operations"""
     
+    DISCOVERY_CACHE_TTL = 60  # Seconds a discovery result is reused
+    
     def __init__(self):
         self.managers = {}
+        self._discovery_cache = None
+        self._discovery_cache_ts = 0.0
         
     def add_azure_manager(self, subscription_id: str):
         """Add Azure VM manager"""
         self.managers[f'azure_{subscription_id}'] = AzureVMManager(subscription_id)
+        self.invalidate_discovery_cache()
         
     def add_aws_manager(self, region: str = 'us-east-1'):
         """Add AWS VM manager"""
         self.managers[f'aws_{region}'] = AWSVMManager(region)
+        self.invalidate_discovery_cache()
         
     def add_gcp_manager(self, project_id: str):
         """Add GCP VM manager"""
         self.managers[f'gcp_{project_id}'] = GCPVMManager(project_id)
+        self.invalidate_discovery_cache()
+    
+    def invalidate_discovery_cache(self):
+        """Force the next discover_all_vms call to query every provider"""
+        self._discovery_cache = None
+        self._discovery_cache_ts = 0.0
         
     def discover_all_vms(self) -> Dict[str, List[VMInfo]]:
-        """Discover VMs across all configured cloud providers"""
-        all_vms = {}
+        """Discover VMs across all configured cloud providers
         
-        for provider, manager in self.managers.items():
-            try:
-                vms = manager.discover_vms()
-                all_vms[provider] = vms
-                logger.info(f"Discovered {len(vms)} VMs in {provider}")
-            except Exception as e:
-                logger.error(f"Error discovering VMs in {provider}: {e}")
-                all_vms[provider] = []
-                
-        return all_vms
+        Providers are independent I/O-bound calls, so they are discovered concurrently.
+        Results are reused for DISCOVERY_CACHE_TTL seconds.
+        """
+        if (self._discovery_cache is not None
+                and time.monotonic() - self._discovery_cache_ts < self.DISCOVERY_CACHE_TTL):
+            return dict(self._discovery_cache)
+        
+        if not self.managers:
+            return {}
+        
+        discovered = {}
+        with ThreadPoolExecutor(max_workers=len(self.managers)) as executor:
+            futures = {executor.submit(manager.discover_vms): provider
+                       for provider, manager in self.managers.items()}
+            for future in as_completed(futures):
+                provider = futures[future]
+                try:
+                    vms = future.result()
+                    discovered[provider] = vms
+                    logger.info(f"Discovered {len(vms)} VMs in {provider}")
+                except Exception as e:
+                    logger.error(f"Error discovering VMs in {provider}: {e}")
+                    discovered[provider] = []
+        
+        # Keep results in the order providers were added
+        self._discovery_cache = {provider: discovered[provider] for provider in self.managers}
+        self._discovery_cache_ts = time.monotonic()
+        return dict(self._discovery_cache)
     
-    def get_total_potential_savings(self) -> Dict[str, float]:
-        """Calculate potential savings across all clouds"""
+    def get_total_potential_savings(self, all_vms: Optional[Dict[str, List[VMInfo]]] = None) -> Dict[str, float]:
+        """Calculate potential savings across all clouds
+        
+        Args:
+            all_vms: Previously discovered VMs by provider; discovered (or taken from cache) when omitted
+        """
         savings = {}
-        all_vms = self.discover_all_vms()
+        if all_vms is None:
+            all_vms = self.discover_all_vms()
         
         for provider, vms in all_vms.items():
             total_savings = sum(vm.potential_savings for vm in vms)
@@ -814,11 +1305,13 @@ class CostOptimizationEngine:
         
     def analyze_cost_optimization(self, vms: List[VMInfo]) -> Dict:
         """Comprehensive cost optimization analysis"""
+        current, byol, savings = _vm_cost_columns(vms)
+        monthly_savings = float(savings.sum())
         analysis = {
-            'current_monthly_cost': sum(vm.monthly_cost_current for vm in vms),
-            'byol_monthly_cost': sum(vm.estimated_monthly_cost_byol for vm in vms),
-            'monthly_savings': sum(vm.potential_savings for vm in vms),
-            'annual_savings': sum(vm.potential_savings for vm in vms) * 12,
+            'current_monthly_cost': float(current.sum()),
+            'byol_monthly_cost': float(byol.sum()),
+            'monthly_savings': monthly_savings,
+            'annual_savings': monthly_savings * 12,
             'optimization_recommendations': [],
             'rightsizing_opportunities': [],
             'scheduling_opportunities': [],
@@ -826,35 +1319,44 @@ class CostOptimizationEngine:
         }
         
         # Add specific optimization recommendations
-        analysis['optimization_recommendations'] = self._generate_optimization_recommendations(vms)
+        analysis['optimization_recommendations'] = self._generate_optimization_recommendations(vms, savings)
         analysis['rightsizing_opportunities'] = self._identify_rightsizing_opportunities(vms)
         analysis['scheduling_opportunities'] = self._identify_scheduling_opportunities(vms)
         
         return analysis
     
-    def _generate_optimization_recommendations(self, vms: List[VMInfo]) -> List[Dict]:
+    def _generate_optimization_recommendations(self, vms: List[VMInfo],
+                                               savings: Optional[np.ndarray] = None) -> List[Dict]:
         """Generate specific optimization recommendations"""
         recommendations = []
+        if savings is None:
+            savings = _vm_cost_columns(vms)[2]
         
         # High-impact conversions
-        high_impact_vms = [vm for vm in vms if vm.potential_savings > 100]
-        if high_impact_vms:
+        high_impact = savings > 100.0
+        high_impact_count = int(np.count_nonzero(high_impact))
+        if high_impact_count:
             recommendations.append({
                 'type': 'high_impact_conversion',
-                'description': f'Convert {len(high_impact_vms)} high-impact VMs for maximum savings',
-                'potential_monthly_savings': sum(vm.potential_savings for vm in high_impact_vms),
-                'vm_count': len(high_impact_vms),
+                'description': f'Convert {high_impact_count} high-impact VMs for maximum savings',
+                'potential_monthly_savings': float(savings[high_impact].sum()),
+                'vm_count': high_impact_count,
                 'priority': 'high'
             })
         
         # Low-risk conversions
-        low_risk_vms = [vm for vm in vms if vm.risk_level in ['low', 'very_low']]
-        if low_risk_vms:
+        low_risk_count = 0
+        low_risk_savings = 0
+        for vm in vms:
+            if vm.risk_level in _LOW_RISK:
+                low_risk_count += 1
+                low_risk_savings += vm.potential_savings
+        if low_risk_count:
             recommendations.append({
                 'type': 'low_risk_conversion',
-                'description': f'Start with {len(low_risk_vms)} low-risk VMs for safe implementation',
-                'potential_monthly_savings': sum(vm.potential_savings for vm in low_risk_vms),
-                'vm_count': len(low_risk_vms),
+                'description': f'Start with {low_risk_count} low-risk VMs for safe implementation',
+                'potential_monthly_savings': low_risk_savings,
+                'vm_count': low_risk_count,
                 'priority': 'medium'
             })
         
@@ -886,7 +1388,7 @@ class CostOptimizationEngine:
         opportunities = []
         
         for vm in vms:
-            if vm.environment_type in ['development', 'testing', 'staging']:
+            if vm.environment_type in _SCHEDULABLE_ENVS:
                 # Assume 40% savings from scheduled operations (12h/day, 5 days/week)
                 potential_savings = vm.monthly_cost_current * 0.4
                 
@@ -931,83 +1433,98 @@ class RiskAssessmentEngine:
             'dependencies',
             'performance_baseline'
         ]
+        # Risk signature -> assessment; VMs of the same shape share one scoring
+        self._risk_cache = {}
     
     def assess_conversion_risk(self, vm: VMInfo) -> Dict:
         """Comprehensive risk assessment for VM conversion"""
-        risk_score = 0
-        risk_factors = []
-        
-        # Business criticality assessment
-        criticality_scores = {
-            'critical': 40,
-            'high': 25,
-            'medium': 15,
-            'low': 5,
-            'unknown': 20
-        }
-        criticality_score = criticality_scores.get(vm.business_criticality, 20)
-        risk_score += criticality_score
-        
-        if criticality_score >= 25:
-            risk_factors.append(f"High business criticality ({vm.business_criticality})")
-        
-        # Environment type assessment
-        env_scores = {
-            'production': 30,
-            'staging': 15,
-            'testing': 5,
-            'development': 0,
-            'unknown': 20
-        }
-        env_score = env_scores.get(vm.environment_type, 20)
-        risk_score += env_score
-        
-        if env_score >= 20:
-            risk_factors.append(f"Production/unknown environment ({vm.environment_type})")
-        
-        # Backup and monitoring assessment
-        if not vm.backup_frequency or vm.backup_frequency == 'none':
-            risk_score += 20
-            risk_factors.append("No regular backups configured")
-        
-        if not vm.monitoring_enabled:
-            risk_score += 15
-            risk_factors.append("No monitoring enabled")
-        
-        # Compliance requirements
-        if vm.compliance_requirements and len(vm.compliance_requirements) > 0:
-            risk_score += 10
-            risk_factors.append(f"Compliance requirements: {', '.join(vm.compliance_requirements)}")
-        
-        # Dependencies assessment
-        if vm.dependencies and len(vm.dependencies) > 3:
-            risk_score += 15
-            risk_factors.append(f"High number of dependencies ({len(vm.dependencies)})")
-        
-        # Performance baseline
-        if not vm.performance_baseline:
-            risk_score += 10
-            risk_factors.append("No performance baseline established")
-        
-        # Determine risk level
-        if risk_score >= 80:
-            risk_level = RiskLevel.CRITICAL
-        elif risk_score >= 60:
-            risk_level = RiskLevel.HIGH
-        elif risk_score >= 40:
-            risk_level = RiskLevel.MEDIUM
-        elif risk_score >= 20:
-            risk_level = RiskLevel.LOW
-        else:
-            risk_level = RiskLevel.VERY_LOW
+        return self.assess_conversion_risks([vm])[0]
+    
+    def assess_conversion_risks(self, vms: List[VMInfo]) -> List[Dict]:
+        """Comprehensive risk assessment for many VMs
         
-        return {
-            'risk_score': risk_score,
-            'risk_level': risk_level.value,
-            'risk_factors': risk_factors,
-            'recommendation': self._get_risk_recommendation(risk_level),
-            'mitigation_steps': self._get_mitigation_steps(risk_factors)
-        }
+        Returns one assessment per VM, in input order. Only VM shapes not seen
+        before by this engine are scored; the rest are served from the cache.
+        """
+        signatures = [_risk_signature(vm) for vm in vms]
+        cache = self._risk_cache
+        
+        pending = {}
+        for vm, signature in zip(vms, signatures):
+            if signature not in cache and signature not in pending:
+                pending[signature] = vm
+        if pending:
+            cache.update(zip(pending, self._score_risks(list(pending.values()))))
+        
+        # Hand out copies so callers can't mutate the cached lists
+        return [
+            {**cached, 'risk_factors': list(cached['risk_factors']),
+             'mitigation_steps': list(cached['mitigation_steps'])}
+            for cached in map(cache.__getitem__, signatures)
+        ]
+    
+    def _score_risks(self, vms: List[VMInfo]) -> List[Dict]:
+        """Score VMs as NumPy columns, one assessment per VM in input order"""
+        n = len(vms)
+        if n == 0:
+            return []
+        
+        # Per-factor score inputs as columns
+        criticality = np.fromiter((_CRITICALITY_SCORES.get(vm.business_criticality, 20) for vm in vms),
+                                  dtype=np.int64, count=n)
+        environment = np.fromiter((_ENV_SCORES.get(vm.environment_type, 20) for vm in vms),
+                                  dtype=np.int64, count=n)
+        no_backup = np.fromiter((not vm.backup_frequency or vm.backup_frequency == 'none' for vm in vms),
+                                dtype=bool, count=n)
+        no_monitoring = np.fromiter((not vm.monitoring_enabled for vm in vms), dtype=bool, count=n)
+        has_compliance = np.fromiter((bool(vm.compliance_requirements) for vm in vms), dtype=bool, count=n)
+        many_dependencies = np.fromiter((bool(vm.dependencies) and len(vm.dependencies) > 3 for vm in vms),
+                                        dtype=bool, count=n)
+        no_baseline = np.fromiter((not vm.performance_baseline for vm in vms), dtype=bool, count=n)
+        
+        risk_scores = (criticality + environment + 20 * no_backup + 15 * no_monitoring
+                       + 10 * has_compliance + 15 * many_dependencies + 10 * no_baseline)
+        
+        # Determine risk level as an index into RiskLevel (VERY_LOW .. CRITICAL)
+        level_codes = np.select(
+            [risk_scores >= 80, risk_scores >= 60, risk_scores >= 40, risk_scores >= 20],
+            [4, 3, 2, 1],
+            default=0
+        )
+        levels = tuple(RiskLevel)
+        
+        # Risk factor descriptions still need per-VM strings
+        assessments = []
+        rows = zip(vms, criticality.tolist(), environment.tolist(), no_backup.tolist(), no_monitoring.tolist(),
+                   has_compliance.tolist(), many_dependencies.tolist(), no_baseline.tolist(),
+                   risk_scores.tolist(), level_codes.tolist())
+        for vm, crit, env, backup, monitoring, compliance, deps, baseline, risk_score, level_code in rows:
+            risk_factors = []
+            if crit >= 25:
+                risk_factors.append(f"High business criticality ({vm.business_criticality})")
+            if env >= 20:
+                risk_factors.append(f"Production/unknown environment ({vm.environment_type})")
+            if backup:
+                risk_factors.append("No regular backups configured")
+            if monitoring:
+                risk_factors.append("No monitoring enabled")
+            if compliance:
+                risk_factors.append(f"Compliance requirements: {', '.join(vm.compliance_requirements)}")
+            if deps:
+                risk_factors.append(f"High number of dependencies ({len(vm.dependencies)})")
+            if baseline:
+                risk_factors.append("No performance baseline established")
+            
+            risk_level = levels[level_code]
+            assessments.append({
+                'risk_score': risk_score,
+                'risk_level': risk_level.value,
+                'risk_factors': risk_factors,
+                'recommendation': self._get_risk_recommendation(risk_level),
+                'mitigation_steps': self._get_mitigation_steps(risk_factors)
+            })
+        
+        return assessments
     
     def _get_risk_recommendation(self, risk_level: RiskLevel) -> str:
         """Get recommendation based on risk level"""
@@ -1020,98 +1537,91 @@ class RiskAssessmentEngine:
         }
         return recommendations.get(risk_level, "Unknown risk level")
     
+    # (keyword in risk factor, mitigation step); the first matching keyword wins
+    _MITIGATION_RULES = (
+        ("backup", "Configure automated backups before conversion"),
+        ("monitoring", "Enable comprehensive monitoring and alerting"),
+        ("compliance", "Review compliance impact and get approval"),
+        ("dependencies", "Map and validate all dependencies"),
+        ("baseline", "Establish performance baseline before conversion"),
+        ("criticality", "Schedule conversion during maintenance window")
+    )
+    
+    _GENERAL_MITIGATION_STEPS = (
+        "Create VM snapshot before conversion",
+        "Prepare rollback procedure",
+        "Schedule conversion during low-usage period"
+    )
+    
     def _get_mitigation_steps(self, risk_factors: List[str]) -> List[str]:
         """Generate mitigation steps based on risk factors"""
-        mitigation_steps = []
+        # Dict keys give an ordered set of steps
+        mitigation_steps = {}
         
         for factor in risk_factors:
-            if "backup" in factor.lower():
-                mitigation_steps.append("Configure automated backups before conversion")
-            elif "monitoring" in factor.lower():
-                mitigation_steps.append("Enable comprehensive monitoring and alerting")
-            elif "compliance" in factor.lower():
-                mitigation_steps.append("Review compliance impact and get approval")
-            elif "dependencies" in factor.lower():
-                mitigation_steps.append("Map and validate all dependencies")
-            elif "baseline" in factor.lower():
-                mitigation_steps.append("Establish performance baseline before conversion")
-            elif "criticality" in factor.lower():
-                mitigation_steps.append("Schedule conversion during maintenance window")
+            factor_lower = factor.lower()
+            for keyword, step in self._MITIGATION_RULES:
+                if keyword in factor_lower:
+                    mitigation_steps[step] = None
+                    break
         
         # Always add general mitigation steps
-        mitigation_steps.extend([
-            "Create VM snapshot before conversion",
-            "Prepare rollback procedure",
-            "Schedule conversion during low-usage period"
-        ])
+        mitigation_steps.update(dict.fromkeys(self._GENERAL_MITIGATION_STEPS))
         
-        return list(set(mitigation_steps))  # Remove duplicates
+        return list(mitigation_steps)
 
 
-class BYOLDashboard:
-    """Interactive dashboard for BYOL conversion tracking and reporting"""
-    
-    def __init__(self, output_dir: str = "byol_reports"):
-        self.output_dir = output_dir
-        self.create_output_directory()
-        
-    def create_output_directory(self):
-        """Create output directory if it doesn't exist"""
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-    
-    def generate_executive_summary(self, analysis_data: Dict) -> str:
-        """Generate executive summary report"""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        html_content = f"""
+# Static executive summary skeleton (styles and page header); only the metrics are interpolated
+_EXEC_SUMMARY_HEAD = """
         <!DOCTYPE html>
         <html>
         <head>
             <title>BYOL Conversion Executive Summary</title>
             <meta charset="UTF-8">
             <style>
-                body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
-                .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 0 20px rgba(0,0,0,0.1); }}
-                .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 10px; margin-bottom: 30px; }}
-                .metric-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 20px 0; }}
-                .metric-card {{ background: #f8f9fa; padding: 20px; border-radius: 8px; border-left: 4px solid #007bff; }}
-                .metric-value {{ font-size: 2em; font-weight: bold; color: #007bff; }}
-                .metric-label {{ color: #6c757d; font-size: 0.9em; margin-top: 5px; }}
-                .section {{ margin: 30px 0; }}
-                .section h2 {{ color: #333; border-bottom: 2px solid #007bff; padding-bottom: 10px; }}
-                .recommendation {{ background: #e3f2fd; padding: 15px; border-radius: 5px; margin: 10px 0; border-left: 4px solid #2196f3; }}
-                .risk-high {{ border-left-color: #f44336; background: #ffebee; }}
-                .risk-medium {{ border-left-color: #ff9800; background: #fff3e0; }}
-                .risk-low {{ border-left-color: #4caf50; background: #e8f5e9; }}
-                .table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-                .table th, .table td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-                .table th {{ background-color: #f8f9fa; font-weight: 600; }}
-                .footer {{ text-align: center; margin-top: 40px; color: #6c757d; font-size: 0.9em; }}
+                body { font-family: 'Segoe UI', Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
+                .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 0 20px rgba(0,0,0,0.1); }
+                .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 10px; margin-bottom: 30px; }
+                .metric-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 20px 0; }
+                .metric-card { background: #f8f9fa; padding: 20px; border-radius: 8px; border-left: 4px solid #007bff; }
+                .metric-value { font-size: 2em; font-weight: bold; color: #007bff; }
+                .metric-label { color: #6c757d; font-size: 0.9em; margin-top: 5px; }
+                .section { margin: 30px 0; }
+                .section h2 { color: #333; border-bottom: 2px solid #007bff; padding-bottom: 10px; }
+                .recommendation { background: #e3f2fd; padding: 15px; border-radius: 5px; margin: 10px 0; border-left: 4px solid #2196f3; }
+                .risk-high { border-left-color: #f44336; background: #ffebee; }
+                .risk-medium { border-left-color: #ff9800; background: #fff3e0; }
+                .risk-low { border-left-color: #4caf50; background: #e8f5e9; }
+                .table { width: 100%; border-collapse: collapse; margin: 20px 0; }
+                .table th, .table td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+                .table th { background-color: #f8f9fa; font-weight: 600; }
+                .footer { text-align: center; margin-top: 40px; color: #6c757d; font-size: 0.9em; }
             </style>
         </head>
         <body>
             <div class="container">
                 <div class="header">
                     <h1>BYOL Conversion Analysis</h1>
-                    <p>Executive Summary - Generated on {timestamp}</p>
+                    <p>Executive Summary - Generated on """
+
+_EXEC_SUMMARY_METRICS = """{timestamp}</p>
                 </div>
                 
                 <div class="metric-grid">
                     <div class="metric-card">
-                        <div class="metric-value">{analysis_data.get('total_vms', 0)}</div>
+                        <div class="metric-value">{total_vms}</div>
                         <div class="metric-label">Total Windows VMs</div>
                     </div>
                     <div class="metric-card">
-                        <div class="metric-value">${analysis_data.get('monthly_savings', 0):,.0f}</div>
+                        <div class="metric-value">${monthly_savings:,.0f}</div>
                         <div class="metric-label">Monthly Savings Potential</div>
                     </div>
                     <div class="metric-card">
-                        <div class="metric-value">${analysis_data.get('annual_savings', 0):,.0f}</div>
+                        <div class="metric-value">${annual_savings:,.0f}</div>
                         <div class="metric-label">Annual Savings Potential</div>
                     </div>
                     <div class="metric-card">
-                        <div class="metric-value">{analysis_data.get('conversion_candidates', 0)}</div>
+                        <div class="metric-value">{conversion_candidates}</div>
                         <div class="metric-label">Conversion Candidates</div>
                     </div>
                 </div>
@@ -1119,20 +1629,52 @@ class BYOLDashboard:
                 <div class="section">
                     <h2>Key Recommendations</h2>
         """
+
+
+class BYOLDashboard:
+    """Interactive dashboard for BYOL conversion tracking and reporting"""
+    
+    def __init__(self, output_dir: str = "byol_reports"):
+        self.output_dir = output_dir
+        self.create_output_directory()
+        
+    def create_output_directory(self):
+        """Create output directory if it doesn't exist"""
+        os.makedirs(self.output_dir, exist_ok=True)
+    
+    def _make_path(self, prefix: str, ext: str, now: Optional[datetime.datetime] = None) -> str:
+        """Build a timestamped report path inside the output directory"""
+        now = now or datetime.datetime.now()
+        return os.path.join(self.output_dir, f"{prefix}_{now.strftime('%Y%m%d_%H%M%S')}.{ext}")
+    
+    def generate_executive_summary(self, analysis_data: Dict) -> str:
+        """Generate executive summary report"""
+        now = datetime.datetime.now()
+        timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+        
+        # Assemble the page in a buffer to avoid quadratic string concatenation
+        buf = io.StringIO()
+        w = buf.write
+        w(_EXEC_SUMMARY_HEAD)
+        w(_EXEC_SUMMARY_METRICS.format(
+            timestamp=timestamp,
+            total_vms=analysis_data.get('total_vms', 0),
+            monthly_savings=analysis_data.get('monthly_savings', 0),
+            annual_savings=analysis_data.get('annual_savings', 0),
+            conversion_candidates=analysis_data.get('conversion_candidates', 0)
+        ))
         
         # Add recommendations
         recommendations = analysis_data.get('optimization_recommendations', [])
-        for rec in recommendations[:5]:  # Top 5 recommendations
-            priority_class = f"risk-{rec.get('priority', 'medium')}"
-            html_content += f"""
-                    <div class="recommendation {priority_class}">
+        w("".join(f"""
+                    <div class="recommendation risk-{rec.get('priority', 'medium')}">
                         <strong>{rec.get('type', 'Recommendation').replace('_', ' ').title()}</strong><br>
                         {rec.get('description', 'No description available')}<br>
                         <small>Potential Monthly Savings: ${rec.get('potential_monthly_savings', 0):,.0f}</small>
                     </div>
-            """
+            """ for rec in recommendations[:5]))  # Top 5 recommendations
         
-        html_content += """
+        w("""
                 </div>
                 
                 <div class="section">
@@ -1147,21 +1689,20 @@ class BYOLDashboard:
                             </tr>
                         </thead>
                         <tbody>
-        """
+        """)
         
         # Add risk assessment data
         risk_summary = analysis_data.get('risk_summary', {})
-        for risk_level, data in risk_summary.items():
-            html_content += f"""
+        w("".join(f"""
                             <tr>
                                 <td>{risk_level.title()}</td>
                                 <td>{data.get('count', 0)}</td>
                                 <td>${data.get('savings', 0):,.0f}</td>
                                 <td>{data.get('recommendation', 'Review required')}</td>
                             </tr>
-            """
+            """ for risk_level, data in risk_summary.items()))
         
-        html_content += """
+        w("""
                         </tbody>
                     </table>
                 </div>
@@ -1173,128 +1714,168 @@ class BYOLDashboard:
             </div>
         </body>
         </html>
-        """
+        """)
         
-        report_path = os.path.join(self.output_dir, f"executive_summary_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.html")
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        report_path = self._make_path('executive_summary', 'html', now)
+        with open(report_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(buf.getvalue())
         
         return report_path
     
     def generate_technical_report(self, vms: List[VMInfo], analysis_data: Dict) -> str:
-        """Generate detailed technical report"""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """Generate detailed technical report
         
-        # Convert to pandas DataFrame for easier manipulation
-        df_data = []
-        for vm in vms:
-            df_data.append({
-                'VM Name': vm.name,
-                'VM ID': vm.vm_id,
-                'Size': vm.size,
-                'Cores': vm.cores,
-                'Memory (GB)': vm.memory_gb,
-                'Current License': vm.current_license_type.value,
-                'Monthly Cost (Current)': vm.monthly_cost_current,
-                'Monthly Cost (BYOL)': vm.estimated_monthly_cost_byol,
-                'Monthly Savings': vm.potential_savings,
-                'Risk Level': vm.risk_level,
-                'Business Criticality': vm.business_criticality,
-                'Environment': vm.environment_type,
-                'Status': vm.status.value
-            })
-        
-        df = pd.DataFrame(df_data)
+        Rows are streamed straight to the workbook in constant-memory mode, and the
+        summary and grouped sheets are accumulated in the same pass over the VMs.
+        """
+        import xlsxwriter
         
         # Save to Excel with multiple sheets
-        excel_path = os.path.join(self.output_dir, f"technical_analysis_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
+        excel_path = self._make_path('technical_analysis', 'xlsx')
         
-        with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='VM Inventory', index=False)
+        workbook = xlsxwriter.Workbook(excel_path, {'constant_memory': True})
+        try:
+            header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+            inventory_ws = workbook.add_worksheet('VM Inventory')
+            summary_ws = workbook.add_worksheet('Summary')
+            risk_ws = workbook.add_worksheet('Risk Analysis')
+            env_ws = workbook.add_worksheet('Environment Analysis')
             
-            # Summary statistics
-            summary_data = {
-                'Metric': ['Total VMs', 'Total Current Monthly Cost', 'Total BYOL Monthly Cost', 
-                          'Total Monthly Savings', 'Total Annual Savings', 'Average Savings per VM'],
-                'Value': [
-                    len(vms),
-                    df['Monthly Cost (Current)'].sum(),
-                    df['Monthly Cost (BYOL)'].sum(),
-                    df['Monthly Savings'].sum(),
-                    df['Monthly Savings'].sum() * 12,
-                    df['Monthly Savings'].mean()
-                ]
-            }
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
+            inventory_ws.write_row(0, 0, (
+                'VM Name', 'VM ID', 'Size', 'Cores', 'Memory (GB)', 'Current License',
+                'Monthly Cost (Current)', 'Monthly Cost (BYOL)', 'Monthly Savings',
+                'Risk Level', 'Business Criticality', 'Environment', 'Status'
+            ), header_format)
+            
+            total_current = 0.0
+            total_byol = 0.0
+            total_savings = 0.0
+            # group -> [VM count, monthly savings, current monthly cost]
+            by_risk = {}
+            by_env = {}
+            
+            for row, vm in enumerate(vms, start=1):
+                inventory_ws.write_row(row, 0, (
+                    vm.name,
+                    vm.vm_id,
+                    vm.size,
+                    vm.cores,
+                    vm.memory_gb,
+                    vm.current_license_type.value,
+                    vm.monthly_cost_current,
+                    vm.estimated_monthly_cost_byol,
+                    vm.potential_savings,
+                    vm.risk_level,
+                    vm.business_criticality,
+                    vm.environment_type,
+                    vm.status.value
+                ))
+                
+                total_current += vm.monthly_cost_current
+                total_byol += vm.estimated_monthly_cost_byol
+                total_savings += vm.potential_savings
+                
+                for groups, key in ((by_risk, vm.risk_level), (by_env, vm.environment_type)):
+                    group = groups.get(key)
+                    if group is None:
+                        groups[key] = [1, vm.potential_savings, vm.monthly_cost_current]
+                    else:
+                        group[0] += 1
+                        group[1] += vm.potential_savings
+                        group[2] += vm.monthly_cost_current
             
-            # Risk analysis
-            risk_analysis = df.groupby('Risk Level').agg({
-                'VM Name': 'count',
-                'Monthly Savings': 'sum',
-                'Monthly Cost (Current)': 'sum'
-            }).rename(columns={'VM Name': 'VM Count'})
-            risk_analysis.to_excel(writer, sheet_name='Risk Analysis')
+            # Summary statistics
+            summary_rows = (
+                ('Total VMs', len(vms)),
+                ('Total Current Monthly Cost', total_current),
+                ('Total BYOL Monthly Cost', total_byol),
+                ('Total Monthly Savings', total_savings),
+                ('Total Annual Savings', total_savings * 12),
+                ('Average Savings per VM', total_savings / len(vms) if vms else None)
+            )
+            summary_ws.write_row(0, 0, ('Metric', 'Value'), header_format)
+            for row, values in enumerate(summary_rows, start=1):
+                summary_ws.write_row(row, 0, values)
             
-            # Environment analysis
-            env_analysis = df.groupby('Environment').agg({
-                'VM Name': 'count',
-                'Monthly Savings': 'sum',
-                'Monthly Cost (Current)': 'sum'
-            }).rename(columns={'VM Name': 'VM Count'})
-            env_analysis.to_excel(writer, sheet_name='Environment Analysis')
+            # Risk and environment analysis
+            for ws, label, groups in ((risk_ws, 'Risk Level', by_risk), (env_ws, 'Environment', by_env)):
+                ws.write_row(0, 0, (label, 'VM Count', 'Monthly Savings', 'Monthly Cost (Current)'), header_format)
+                for row, key in enumerate(sorted(groups), start=1):
+                    ws.write_row(row, 0, (key, *groups[key]))
+        finally:
+            workbook.close()
         
         return excel_path
     
     def generate_conversion_plan(self, vms: List[VMInfo], risk_assessments: Dict) -> str:
         """Generate step-by-step conversion plan"""
+        import pandas as pd
+        
         plan_data = []
         
-        # Sort VMs by risk level and potential savings
+        # Sort VMs by risk level and potential savings (lexsort is stable, like sorted)
         risk_order = {'very_low': 1, 'low': 2, 'medium': 3, 'high': 4, 'critical': 5}
-        sorted_vms = sorted(vms, key=lambda x: (risk_order.get(x.risk_level, 3), -x.potential_savings))
+        n = len(vms)
+        ranks = np.fromiter((risk_order.get(vm.risk_level, 3) for vm in vms), dtype=np.int8, count=n)
+        savings = np.fromiter((vm.potential_savings for vm in vms), dtype=np.float64, count=n)
+        on_demand = np.fromiter((vm.current_license_type == LicenseType.ON_DEMAND for vm in vms), dtype=bool, count=n)
+        order = np.lexsort((-savings, ranks))
+        sorted_ranks = ranks[order].tolist()
+        order = order.tolist()
         
         phase = 1
         current_phase_vms = []
+        # phase -> [VM count, monthly savings, {risk level: count}]
+        phase_stats = {}
         
-        for i, vm in enumerate(sorted_vms):
-            if vm.current_license_type == LicenseType.ON_DEMAND:  # Only convert non-BYOL VMs
-                risk_assessment = risk_assessments.get(vm.vm_id, {})
-                
-                plan_data.append({
-                    'Phase': phase,
-                    'VM Name': vm.name,
-                    'VM ID': vm.vm_id,
-                    'Risk Level': vm.risk_level,
-                    'Monthly Savings': vm.potential_savings,
-                    'Business Criticality': vm.business_criticality,
-                    'Environment': vm.environment_type,
-                    'Recommended Timeline': self._get_timeline_recommendation(vm.risk_level),
-                    'Prerequisites': '; '.join(risk_assessment.get('mitigation_steps', [])),
-                    'Estimated Duration': self._get_duration_estimate(vm.risk_level)
-                })
-                
-                current_phase_vms.append(vm)
-                
-                # Start new phase after 10 VMs or when risk level changes significantly
-                if len(current_phase_vms) >= 10 or (i < len(sorted_vms) - 1 and 
-                    risk_order.get(sorted_vms[i+1].risk_level, 3) > risk_order.get(vm.risk_level, 3)):
-                    phase += 1
-                    current_phase_vms = []
+        # Only convert non-BYOL VMs; positions index into the sorted order
+        for i in np.flatnonzero(on_demand[order]).tolist():
+            vm = vms[order[i]]
+            risk_assessment = risk_assessments.get(vm.vm_id, {})
+            
+            plan_data.append({
+                'Phase': phase,
+                'VM Name': vm.name,
+                'VM ID': vm.vm_id,
+                'Risk Level': vm.risk_level,
+                'Monthly Savings': vm.potential_savings,
+                'Business Criticality': vm.business_criticality,
+                'Environment': vm.environment_type,
+                'Recommended Timeline': self._get_timeline_recommendation(vm.risk_level),
+                'Prerequisites': '; '.join(risk_assessment.get('mitigation_steps', [])),
+                'Estimated Duration': self._get_duration_estimate(vm.risk_level)
+            })
+            
+            current_phase_vms.append(vm)
+            
+            stats = phase_stats.get(phase)
+            if stats is None:
+                stats = phase_stats[phase] = [0, 0, {}]
+            stats[0] += 1
+            stats[1] += vm.potential_savings
+            stats[2][vm.risk_level] = stats[2].get(vm.risk_level, 0) + 1
+            
+            # Start new phase after 10 VMs or when risk level changes significantly
+            if len(current_phase_vms) >= 10 or (i < n - 1 and sorted_ranks[i + 1] > sorted_ranks[i]):
+                phase += 1
+                current_phase_vms = []
         
         # Save conversion plan
         plan_df = pd.DataFrame(plan_data)
-        plan_path = os.path.join(self.output_dir, f"conversion_plan_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
+        plan_path = self._make_path('conversion_plan', 'xlsx')
         
         with pd.ExcelWriter(plan_path, engine='openpyxl') as writer:
             plan_df.to_excel(writer, sheet_name='Conversion Plan', index=False)
             
-            # Phase summary
-            phase_summary = plan_df.groupby('Phase').agg({
-                'VM Name': 'count',
-                'Monthly Savings': 'sum',
-                'Risk Level': lambda x: x.mode().iloc[0] if not x.empty else 'unknown'
-            }).rename(columns={'VM Name': 'VM Count', 'Risk Level': 'Primary Risk Level'})
+            # Phase summary; the primary risk level is the most common one, ties broken alphabetically
+            phase_rows = []
+            for phase_number, (vm_count, phase_savings, risk_counts) in phase_stats.items():
+                top_count = max(risk_counts.values())
+                primary_risk = min(level for level, count in risk_counts.items() if count == top_count)
+                phase_rows.append((phase_number, vm_count, phase_savings, primary_risk))
+            phase_summary = pd.DataFrame(
+                phase_rows, columns=['Phase', 'VM Count', 'Monthly Savings', 'Primary Risk Level']
+            ).set_index('Phase')
             phase_summary.to_excel(writer, sheet_name='Phase Summary')
         
         return plan_path
@@ -1352,26 +1933,35 @@ class MonitoringIntegration:
             'status': 'success'
         }
         
-        # Compare key metrics
-        for metric, pre_value in pre_conversion_metrics.items():
-            post_value = post_conversion_metrics.get(metric)
-            if post_value is not None:
-                variance = abs(post_value - pre_value) / pre_value if pre_value != 0 else 0
-                comparison['metrics_comparison'][metric] = {
-                    'pre_conversion': pre_value,
-                    'post_conversion': post_value,
-                    'variance_percent': variance * 100,
-                    'status': 'normal' if variance < self.alert_thresholds.get('cost_variance', 0.15) else 'alert'
-                }
-                
-                # Generate alerts for significant variances
-                if variance > self.alert_thresholds.get('cost_variance', 0.15):
-                    comparison['alerts'].append({
-                        'type': 'performance_variance',
-                        'metric': metric,
-                        'variance': variance * 100,
-                        'threshold': self.alert_thresholds.get('cost_variance', 0.15) * 100
-                    })
+        # Compare key metrics present on both sides as aligned arrays
+        metrics = [metric for metric in pre_conversion_metrics
+                   if post_conversion_metrics.get(metric) is not None]
+        n = len(metrics)
+        pre = np.fromiter((pre_conversion_metrics[m] for m in metrics), dtype=np.float64, count=n)
+        post = np.fromiter((post_conversion_metrics[m] for m in metrics), dtype=np.float64, count=n)
+        variances = np.divide(np.abs(post - pre), pre, out=np.zeros(n), where=pre != 0)
+        
+        threshold = self.alert_thresholds.get('cost_variance', 0.15)
+        is_normal = (variances < threshold).tolist()
+        is_alert = (variances > threshold).tolist()
+        variance_percents = (variances * 100).tolist()
+        
+        for metric, variance_percent, normal, alert in zip(metrics, variance_percents, is_normal, is_alert):
+            comparison['metrics_comparison'][metric] = {
+                'pre_conversion': pre_conversion_metrics[metric],
+                'post_conversion': post_conversion_metrics[metric],
+                'variance_percent': variance_percent,
+                'status': 'normal' if normal else 'alert'
+            }
+            
+            # Generate alerts for significant variances
+            if alert:
+                comparison['alerts'].append({
+                    'type': 'performance_variance',
+                    'metric': metric,
+                    'variance': variance_percent,
+                    'threshold': threshold * 100
+                })
         
         # Set overall status
         if comparison['alerts']:
@@ -1389,13 +1979,29 @@ class MonitoringIntegration:
         }
         
         # In practice, this would integrate with Teams, Slack, email, etc.
-        logger.info(f"Conversion notification: {notification}")
+        logger.info("Conversion notification: %s", notification)
         return notification
 
 
 class BYOLConverter:
     """Enhanced main class for BYOL conversion process with comprehensive features"""
     
+    POST_CONVERSION_SETTLE_SECONDS = 30  # Wait for license changes to take effect before validating
+    
+    # Step lists reported by every successful simulation
+    _SIM_STEPS = (
+        "✅ License availability verified",
+        "✅ Snapshot creation would succeed",
+        "✅ VM conversion to BYOL would succeed",
+        "✅ License allocation would complete"
+    )
+    _SIM_STEPS_TEST_MODE = (
+        "✅ License availability verified",
+        "⏭️ Snapshot skipped (test mode)",
+        "✅ VM conversion to BYOL would succeed",
+        "✅ License allocation would complete"
+    )
+    
     def __init__(self, cloud_provider: CloudProvider = CloudProvider.AZURE, dry_run: bool = False, **kwargs):
         self.dry_run = dry_run
         self.cloud_provider = cloud_provider
@@ -1405,6 +2011,9 @@ class BYOLConverter:
         self.cost_engine = CostOptimizationEngine()
         self.risk_engine = RiskAssessmentEngine()
         self.dashboard = BYOLDashboard(kwargs.get('output_dir', 'byol_reports'))
+        # Conversion concurrency; None sizes the limit from the plan (see execute_conversion_plan)
+        self.max_concurrent_conversions = kwargs.get('max_concurrent_conversions')
+        self.submission_batch_size = kwargs.get('submission_batch_size', 20)
         self.monitoring = MonitoringIntegration()
         
         # Initialize VM managers
@@ -1454,10 +2063,30 @@ class BYOLConverter:
         else:
             raise NotImplementedError(f"Provider {cloud_provider} not implemented")
         
-        # Conversion tracking
-        self.conversion_log = []
+        # Start of this run; stamps the file names written for it
+        self.run_timestamp = datetime.datetime.now()
+        
+        # Conversion tracking; results stream to an NDJSON log as they finish
+        # instead of accumulating in memory (see _record_conversion)
+        mode_prefix = "dryrun_" if dry_run else "live_"
+        self.conversion_log_path = kwargs.get('conversion_log_file') or \
+            f"{mode_prefix}conversion_log_{self.run_timestamp.strftime('%Y%m%d_%H%M%S')}.ndjson"
+        self._conversion_log_fp = None
+        self._conversion_log_finalizer = None
+        self._conversion_log_lock = threading.Lock()
+        self._conversion_counts = {'success': 0, 'fail': 0}
         self.conversion_history = []
         self.rollback_snapshots = {}
+        # vm_id -> VMInfo, refreshed once per conversion plan execution
+        self._vm_index: Dict[str, VMInfo] = {}
+        # Worker threads for blocking conversion steps while a plan executes (see _run_blocking)
+        self._conversion_executor: Optional[ThreadPoolExecutor] = None
+        # Cost/license columns of the last analyzed inventory (see _inventory_columns)
+        self._columns_source = None
+        self._cost_current = self._cost_byol = self._savings = self._license_codes = None
+        # Last discovered inventory, shared by every pipeline step (see _get_vms)
+        self._discovery_cache: Optional[List[VMInfo]] = None
+        self._discovery_ts: float = 0
         
         # Performance tracking
         self.pre_conversion_metrics = {}
@@ -1466,38 +2095,29 @@ class BYOLConverter:
         if self.dry_run:
             logger.info("🔍 DRY RUN MODE ENABLED - No actual changes will be made")
     
-    async def run_comprehensive_analysis(self) -> Dict:
-        """Run complete BYOL analysis with all enhanced features"""
+    async def run_comprehensive_analysis(self, generate_reports: bool = True) -> Dict:
+        """Run complete BYOL analysis with all enhanced features
+        
+        With generate_reports=False the analysis is returned without writing the
+        Excel/HTML report files.
+        """
         logger.info("🚀 Starting comprehensive BYOL analysis...")
         
         # Step 1: Discover VM inventory
         logger.info("📊 Step 1: Discovering VM inventory...")
-        if self.multi_subscription_mode and hasattr(self.vm_manager, 'discover_all_subscriptions_vms'):
-            # Multi-subscription Azure or multi-cloud
-            if isinstance(self.vm_manager, MultiSubscriptionAzureManager):
-                all_vms_by_sub = self.vm_manager.discover_all_subscriptions_vms()
-                vms = self.vm_manager.get_consolidated_vm_list()
-                subscription_summary = self.vm_manager.get_subscription_summary()
-            else:
-                # Multi-cloud
-                all_vms_by_provider = self.vm_manager.discover_all_vms()
-                vms = []
-                for provider_vms in all_vms_by_provider.values():
-                    vms.extend(provider_vms)
-                subscription_summary = None
+        vms = self._get_vms()
+        if self.multi_subscription_mode and isinstance(self.vm_manager, MultiSubscriptionAzureManager):
+            subscription_summary = self.vm_manager.get_subscription_summary(self.vms_by_subscription())
         else:
-            # Single subscription/provider
-            vms = self.vm_manager.discover_vms()
-            all_vms_by_sub = None
             subscription_summary = None
         
         logger.info(f"Found {len(vms)} Windows VMs")
         
         # Step 2: Enhanced risk assessment
         logger.info("⚡ Step 2: Performing enhanced risk assessment...")
+        # The engine scores each distinct risk signature once and hands every VM its own copy
         risk_assessments = {}
-        for vm in vms:
-            risk_assessment = self.risk_engine.assess_conversion_risk(vm)
+        for vm, risk_assessment in zip(vms, self.risk_engine.assess_conversion_risks(vms)):
             risk_assessments[vm.vm_id] = risk_assessment
             # Update VM risk level with enhanced assessment
             vm.risk_level = risk_assessment['risk_level']
@@ -1525,23 +2145,21 @@ class BYOLConverter:
             'subscription_summary': subscription_summary,
             'vm_inventory': {
                 'total_vms': len(vms),
-                'by_provider': self._get_vm_distribution_by_provider(vms),
-                'by_risk_level': self._get_vm_distribution_by_risk(vms),
-                'by_environment': self._get_vm_distribution_by_environment(vms),
-                'by_subscription': self._get_vm_distribution_by_subscription(vms) if self.multi_subscription_mode else None
+                **self._compute_distributions(vms, by_subscription=self.multi_subscription_mode)
             },
             'cost_analysis': cost_analysis,
             'license_analysis': license_analysis,
             'roi_analysis': roi_analysis,
             'risk_summary': self._generate_risk_summary(vms, risk_assessments),
-            'conversion_candidates': len([vm for vm in vms if vm.current_license_type == LicenseType.ON_DEMAND]),
+            'conversion_candidates': license_analysis['on_demand_vms'],
             'optimization_recommendations': cost_analysis['optimization_recommendations'],
             'implementation_timeline': self._generate_implementation_timeline(vms, risk_assessments)
         }
         
         # Step 6: Generate reports
-        logger.info("📋 Step 6: Generating comprehensive reports...")
-        await self._generate_all_reports(vms, comprehensive_analysis, risk_assessments)
+        if generate_reports:
+            logger.info("📋 Step 6: Generating comprehensive reports...")
+            await self._generate_all_reports(vms, comprehensive_analysis, risk_assessments)
         
         return comprehensive_analysis
     
@@ -1563,40 +2181,107 @@ class BYOLConverter:
             'warnings': []
         }
         
-        # Process conversions with concurrent execution
-        semaphore = asyncio.Semaphore(5)  # Limit concurrent conversions
-        
-        async def convert_single_vm(vm_id: str):
-            async with semaphore:
-                return await self._execute_single_conversion(vm_id, execution_results)
-        
-        # Execute conversions
-        conversion_tasks = [convert_single_vm(vm_id) for vm_id in vm_ids]
-        results = await asyncio.gather(*conversion_tasks, return_exceptions=True)
-        
-        # Process results
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                execution_results['failed_conversions'].append({
-                    'vm_id': vm_ids[i],
-                    'error': str(result),
+        # Discover once up front; each conversion looks its VM up by ID
+        try:
+            self._vm_index = {vm.vm_id: vm for vm in self._get_vms()}
+        except Exception as e:
+            logger.error(f"❌ VM discovery failed before conversion: {e}")
+            self._vm_index = {}
+        
+        # Baseline metrics for the whole phase in one concurrent round
+        if not self.dry_run:
+            self.pre_conversion_metrics.update(await self._collect_metrics_batch(vm_ids, 'pre'))
+        
+        # Process conversions with concurrent execution; large plans get more slots
+        # since the cap, not the cloud API, is usually the bottleneck
+        max_concurrent = self.max_concurrent_conversions or max(5, min(32, len(vm_ids) // 4))
+        batch_size = max(1, self.submission_batch_size)
+        semaphore = asyncio.Semaphore(max_concurrent)
+        # Blocking SDK and license calls run here, so max_concurrent of them really overlap
+        self._conversion_executor = ThreadPoolExecutor(max_workers=max_concurrent)
+        # Converted VMs wait out the settle delay here instead of holding a conversion slot
+        validation_queue = asyncio.Queue()
+        validator = asyncio.create_task(self._validation_worker(validation_queue))
+        
+        async def convert_single_vm(vm_id: str) -> Tuple[Dict, bool]:
+            """Returns (result, crashed); crashed results are failure records built here"""
+            try:
+                async with semaphore:
+                    conversion_result, vm_info, pre_metrics = await self._do_convert(vm_id)
+                if 'error' in conversion_result:
+                    return conversion_result, False
+                return await self._do_validate(conversion_result, vm_info, pre_metrics,
+                                               execution_results, validation_queue), False
+            except Exception as e:
+                return {
+                    'vm_id': vm_id,
+                    'error': str(e),
                     'timestamp': datetime.datetime.now().isoformat()
-                })
+                }, True
+        
+        # Execute conversions, submitting in batches and holding back while a
+        # full window of conversions is already queued behind the semaphore
+        conversion_tasks = []
+        pending = set()
+        try:
+            for start in range(0, len(vm_ids), batch_size):
+                for vm_id in vm_ids[start:start + batch_size]:
+                    task = asyncio.ensure_future(convert_single_vm(vm_id))
+                    conversion_tasks.append(task)
+                    pending.add(task)
+                while len(pending) >= max_concurrent + batch_size:
+                    _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            results = await asyncio.gather(*conversion_tasks)
+        finally:
+            validator.cancel()
+            self._conversion_executor.shutdown(wait=False)
+            self._conversion_executor = None
+        
+        # Process results in one pass
+        successful = execution_results['successful_conversions']
+        failed = execution_results['failed_conversions']
+        success_count = 0
+        cost_impact = 0.0
+        for result, crashed in results:
+            if crashed:
+                failed.append(result)
             elif result and result.get('success'):
-                execution_results['successful_conversions'].append(result)
-                execution_results['cost_impact'] += result.get('monthly_savings', 0)
+                successful.append(result)
+                success_count += 1
+                cost_impact += result.get('monthly_savings', 0)
+        execution_results['cost_impact'] += cost_impact
         
         execution_results['end_time'] = datetime.datetime.now().isoformat()
-        execution_results['success_rate'] = len(execution_results['successful_conversions']) / len(vm_ids) * 100
+        execution_results['success_rate'] = success_count / len(vm_ids) * 100
+        if not self.dry_run and success_count:
+            # License types changed; the next step must see the new inventory
+            self.invalidate_vm_cache()
         
         # Log summary
-        logger.info(f"✅ Conversion completed: {len(execution_results['successful_conversions'])}/{len(vm_ids)} successful")
+        logger.info(f"✅ Conversion completed: {success_count}/{len(vm_ids)} successful")
         logger.info(f"💰 Total monthly savings: ${execution_results['cost_impact']:,.2f}")
         
         return execution_results
     
     async def _execute_single_conversion(self, vm_id: str, execution_results: Dict) -> Dict:
         """Execute conversion for a single VM with comprehensive safety checks"""
+        conversion_result, vm_info, pre_metrics = await self._do_convert(vm_id)
+        if 'error' in conversion_result:
+            return conversion_result
+        return await self._do_validate(conversion_result, vm_info, pre_metrics, execution_results)
+    
+    async def _run_blocking(self, func, *args):
+        """Run a blocking cloud or license call off the event loop
+        
+        Uses the plan's conversion pool while execute_conversion_plan runs, else the default executor.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._conversion_executor, func, *args)
+    
+    async def _do_convert(self, vm_id: str) -> Tuple[Dict, Optional[VMInfo], Optional[Dict]]:
+        """Run the pre-validation, snapshot, license and conversion steps for one VM
+        
+        Returns (conversion_result, vm_info, pre_metrics); a failed result carries 'error'.
+        """
         conversion_result = {
             'vm_id': vm_id,
             'success': False,
@@ -1605,19 +2290,23 @@ class BYOLConverter:
             'rollback_info': {},
             'monthly_savings': 0.0
         }
+        vm_info = None
+        pre_metrics = None
         
         try:
             # Step 1: Pre-conversion validation
             logger.info(f"🔍 Pre-conversion validation for {vm_id}")
             if not self.dry_run:
-                pre_metrics = await self._collect_pre_conversion_metrics(vm_id)
-                self.pre_conversion_metrics[vm_id] = pre_metrics
+                pre_metrics = self.pre_conversion_metrics.get(vm_id)
+                if pre_metrics is None:
+                    pre_metrics = await self._collect_pre_conversion_metrics(vm_id)
+                    self.pre_conversion_metrics[vm_id] = pre_metrics
             conversion_result['steps_completed'].append('pre_validation')
             
             # Step 2: Create snapshot/backup
             logger.info(f"📸 Creating snapshot for {vm_id}")
             if not self.dry_run:
-                snapshot_id = self.vm_manager.create_snapshot(vm_id)
+                snapshot_id = await self._run_blocking(self.vm_manager.create_snapshot, vm_id)
                 self.rollback_snapshots[vm_id] = snapshot_id
                 conversion_result['rollback_info']['snapshot_id'] = snapshot_id
             else:
@@ -1627,12 +2316,13 @@ class BYOLConverter:
             # Step 3: License allocation
             logger.info(f"🔑 Allocating license for {vm_id}")
             # Get VM info to determine required license
-            vm_info = next((vm for vm in self.vm_manager.discover_vms() if vm.vm_id == vm_id), None)
+            vm_info = self._vm_index.get(vm_id)
             if not vm_info:
                 raise Exception(f"VM {vm_id} not found")
             
             if not self.dry_run:
-                license = self.license_manager.allocate_license(vm_id, "Standard", vm_info.cores)
+                license = await self._run_blocking(self.license_manager.allocate_license,
+                                                   vm_id, "Standard", vm_info.cores)
                 if not license:
                     raise Exception(f"No available license for {vm_id}")
             conversion_result['steps_completed'].append('license_allocation')
@@ -1640,20 +2330,42 @@ class BYOLConverter:
             # Step 4: Perform conversion
             logger.info(f"🔄 Converting {vm_id} to BYOL")
             if not self.dry_run:
-                conversion_success = self.vm_manager.convert_to_byol(vm_id)
+                conversion_success = await self._run_blocking(self.vm_manager.convert_to_byol, vm_id)
                 if not conversion_success:
                     raise Exception(f"Conversion failed for {vm_id}")
             conversion_result['steps_completed'].append('conversion')
             
+        except Exception as e:
+            await self._fail_conversion(conversion_result, e)
+        
+        return conversion_result, vm_info, pre_metrics
+    
+    async def _do_validate(self, conversion_result: Dict, vm_info: VMInfo, pre_metrics: Optional[Dict],
+                           execution_results: Dict, validation_queue: Optional[asyncio.Queue] = None) -> Dict:
+        """Run post-conversion validation for a converted VM and finalize its result
+        
+        With a validation_queue the settle delay and metric collection are handled by
+        _validation_worker in batches; otherwise this call waits inline.
+        """
+        vm_id = conversion_result['vm_id']
+        
+        try:
             # Step 5: Post-conversion validation
             logger.info(f"✅ Post-conversion validation for {vm_id}")
             if not self.dry_run:
-                await asyncio.sleep(30)  # Wait for changes to take effect
-                post_metrics = await self._collect_post_conversion_metrics(vm_id)
-                self.post_conversion_metrics[vm_id] = post_metrics
+                if validation_queue is None:
+                    await asyncio.sleep(self.POST_CONVERSION_SETTLE_SECONDS)  # Wait for changes to take effect
+                    post_metrics = await self._collect_post_conversion_metrics(vm_id)
+                    self.post_conversion_metrics[vm_id] = post_metrics
+                    validation_result = self._validate_conversion(vm_id, pre_metrics, post_metrics)
+                else:
+                    loop = asyncio.get_running_loop()
+                    validated = loop.create_future()
+                    deadline = loop.time() + self.POST_CONVERSION_SETTLE_SECONDS
+                    await validation_queue.put((deadline, vm_id, pre_metrics, validated))
+                    validation_result = await validated
                 
                 # Validate conversion success
-                validation_result = self._validate_conversion(vm_id, pre_metrics, post_metrics)
                 if not validation_result['success']:
                     execution_results['warnings'].append(f"Validation issues for {vm_id}: {validation_result['issues']}")
             
@@ -1665,18 +2377,95 @@ class BYOLConverter:
             logger.info(f"✅ Successfully converted {vm_id}")
             
         except Exception as e:
-            logger.error(f"❌ Conversion failed for {vm_id}: {e}")
-            conversion_result['error'] = str(e)
-            conversion_result['end_time'] = datetime.datetime.now().isoformat()
-            
-            # Attempt rollback if needed
-            if 'conversion' in conversion_result['steps_completed'] and not self.dry_run:
-                logger.info(f"🔄 Initiating rollback for {vm_id}")
-                rollback_result = await self._rollback_conversion(vm_id, conversion_result['rollback_info'])
-                conversion_result['rollback_result'] = rollback_result
+            await self._fail_conversion(conversion_result, e)
         
         return conversion_result
     
+    async def _fail_conversion(self, conversion_result: Dict, error: Exception):
+        """Record a conversion failure and roll back if the license was already switched"""
+        vm_id = conversion_result['vm_id']
+        logger.error(f"❌ Conversion failed for {vm_id}: {error}")
+        conversion_result['error'] = str(error)
+        conversion_result['end_time'] = end_time = datetime.datetime.now().isoformat()
+        
+        # Attempt rollback if needed; it is stamped with the failure time
+        if 'conversion' in conversion_result['steps_completed'] and not self.dry_run:
+            logger.info(f"🔄 Initiating rollback for {vm_id}")
+            rollback_result = await self._rollback_conversion(vm_id, conversion_result['rollback_info'],
+                                                              timestamp=end_time)
+            conversion_result['rollback_result'] = rollback_result
+    
+    async def _validation_worker(self, queue: asyncio.Queue):
+        """Collect post-conversion metrics in batches once each VM's settle delay has passed
+        
+        Queue items are (deadline, vm_id, pre_metrics, future); deadlines arrive in order
+        because every VM waits the same delay. Runs until cancelled; a failed round fails
+        only its own VMs, and on exit every future still outstanding is failed so no
+        conversion is left waiting.
+        """
+        loop = asyncio.get_running_loop()
+        waiting = deque()
+        ready = []
+        
+        try:
+            while True:
+                if not waiting:
+                    waiting.append(await queue.get())
+                await asyncio.sleep(max(0.0, waiting[0][0] - loop.time()))
+                
+                # Pick up everything queued while sleeping, then validate all VMs that are due
+                while not queue.empty():
+                    waiting.append(queue.get_nowait())
+                now = loop.time()
+                ready = []
+                while waiting and waiting[0][0] <= now:
+                    ready.append(waiting.popleft())
+                
+                try:
+                    collected = await self._collect_metrics_batch([vm_id for _, vm_id, _, _ in ready], 'post')
+                except Exception as e:
+                    for _, _, _, validated in ready:
+                        if not validated.done():
+                            validated.set_exception(e)
+                    continue
+                for _, vm_id, pre_metrics, validated in ready:
+                    if validated.done():
+                        continue
+                    post_metrics = collected.get(vm_id)
+                    if post_metrics is None:
+                        validated.set_exception(RuntimeError(f"Post-conversion metrics unavailable for {vm_id}"))
+                        continue
+                    self.post_conversion_metrics[vm_id] = post_metrics
+                    try:
+                        validated.set_result(self._validate_conversion(vm_id, pre_metrics, post_metrics))
+                    except Exception as e:
+                        validated.set_exception(e)
+        finally:
+            while not queue.empty():
+                waiting.append(queue.get_nowait())
+            for _, vm_id, _, validated in (*ready, *waiting):
+                if not validated.done():
+                    validated.set_exception(RuntimeError(f"Validation stopped before {vm_id} was validated"))
+    
+    async def _collect_metrics_batch(self, vm_ids: List[str], phase: str) -> Dict[str, Dict]:
+        """Collect 'pre' or 'post' conversion metrics for many VMs in one concurrent round
+        
+        VMs whose collection fails are logged and left out of the result.
+        """
+        if phase == 'pre':
+            collect = self._collect_pre_conversion_metrics
+        else:
+            collect = self._collect_post_conversion_metrics
+        outcomes = await asyncio.gather(*[collect(vm_id) for vm_id in vm_ids], return_exceptions=True)
+        
+        metrics = {}
+        for vm_id, outcome in zip(vm_ids, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"❌ Failed to collect {phase}-conversion metrics for {vm_id}: {outcome}")
+            else:
+                metrics[vm_id] = outcome
+        return metrics
+    
     async def _collect_pre_conversion_metrics(self, vm_id: str) -> Dict:
         """Collect baseline metrics before conversion"""
         # In practice, integrate with monitoring systems
@@ -1701,6 +2490,12 @@ class BYOLConverter:
             'availability': 99.94
         }
     
+    # metric -> (allowed post/pre factor, direction that counts as degradation)
+    _THRESHOLD = MappingProxyType({
+        'response_time': (1.10, 'increase'),  # 10% increase in response time
+        'availability': (0.99, 'decrease')  # 1% decrease in availability
+    })
+    
     def _validate_conversion(self, vm_id: str, pre_metrics: Dict, post_metrics: Dict) -> Dict:
         """Validate conversion success by comparing metrics"""
         validation_result = {
@@ -1709,11 +2504,14 @@ class BYOLConverter:
         }
         
         # Check for significant performance degradation
-        for metric, pre_value in pre_metrics.items():
+        for metric, (factor, direction) in self._THRESHOLD.items():
+            if metric not in pre_metrics:
+                continue
+            pre_value = pre_metrics[metric]
             post_value = post_metrics.get(metric, pre_value)
-            if metric in ['response_time'] and post_value > pre_value * 1.1:  # 10% increase in response time
+            if direction == 'increase' and post_value > pre_value * factor:
                 validation_result['issues'].append(f"{metric} increased by {((post_value/pre_value-1)*100):.1f}%")
-            elif metric in ['availability'] and post_value < pre_value * 0.99:  # 1% decrease in availability
+            elif direction == 'decrease' and post_value < pre_value * factor:
                 validation_result['issues'].append(f"{metric} decreased by {((1-post_value/pre_value)*100):.1f}%")
         
         if validation_result['issues']:
@@ -1721,23 +2519,24 @@ class BYOLConverter:
         
         return validation_result
     
-    async def _rollback_conversion(self, vm_id: str, rollback_info: Dict) -> Dict:
+    async def _rollback_conversion(self, vm_id: str, rollback_info: Dict,
+                                   timestamp: Optional[str] = None) -> Dict:
         """Rollback conversion if issues are detected"""
         rollback_result = {
             'success': False,
             'actions_taken': [],
-            'timestamp': datetime.datetime.now().isoformat()
+            'timestamp': timestamp or datetime.datetime.now().isoformat()
         }
         
         try:
             # Release allocated license
-            self.license_manager.release_license(vm_id)
+            await self._run_blocking(self.license_manager.release_license, vm_id)
             rollback_result['actions_taken'].append('license_released')
             
             # Revert from snapshot
             snapshot_id = rollback_info.get('snapshot_id')
             if snapshot_id:
-                revert_success = self.vm_manager.revert_from_snapshot(vm_id, snapshot_id)
+                revert_success = await self._run_blocking(self.vm_manager.revert_from_snapshot, vm_id, snapshot_id)
                 if revert_success:
                     rollback_result['actions_taken'].append('snapshot_reverted')
                 else:
@@ -1753,22 +2552,27 @@ class BYOLConverter:
         return rollback_result
     
     async def _generate_all_reports(self, vms: List[VMInfo], analysis: Dict, risk_assessments: Dict):
-        """Generate all comprehensive reports"""
+        """Generate all comprehensive reports
+        
+        The reports are independent file writers, so they run concurrently on the
+        default executor.
+        """
+        loop = asyncio.get_running_loop()
         try:
-            # Executive summary (generates HTML file)
-            executive_html_path = self.dashboard.generate_executive_summary(analysis)
+            (executive_html_path, technical_excel_path,
+             conversion_plan_path, cost_report) = await asyncio.gather(
+                # Executive summary (generates HTML file)
+                loop.run_in_executor(None, self.dashboard.generate_executive_summary, analysis),
+                # Technical analysis (generates Excel file)
+                loop.run_in_executor(None, self.dashboard.generate_technical_report, vms, analysis),
+                # Conversion plan (generates Excel file)
+                loop.run_in_executor(None, self.dashboard.generate_conversion_plan, vms, risk_assessments),
+                # Additional cost analysis report
+                loop.run_in_executor(None, self.generate_cost_analysis_report, vms, analysis)
+            )
             logger.info(f"📊 Executive summary generated: {executive_html_path}")
-            
-            # Technical analysis (generates Excel file)
-            technical_excel_path = self.dashboard.generate_technical_report(vms, analysis)
             logger.info(f"📋 Technical analysis Excel generated: {technical_excel_path}")
-            
-            # Conversion plan (generates Excel file)
-            conversion_plan_path = self.dashboard.generate_conversion_plan(vms, risk_assessments)
             logger.info(f"📅 Conversion plan generated: {conversion_plan_path}")
-            
-            # Generate additional cost analysis report
-            cost_report = self.generate_cost_analysis_report(vms, analysis)
             logger.info(f"💰 Cost analysis report: {cost_report}")
             
             print(f"\n🎉 Reports generated successfully!")
@@ -1780,53 +2584,35 @@ class BYOLConverter:
             logger.error(f"Error generating reports: {e}")
             print(f"❌ Error generating reports: {e}")
     
-    def _get_vm_distribution_by_provider(self, vms: List[VMInfo]) -> Dict:
-        """Get VM distribution by cloud provider"""
-        distribution = {}
-        for vm in vms:
-            provider = vm.region if hasattr(vm, 'region') else 'azure'  # Default to azure
-            distribution[provider] = distribution.get(provider, 0) + 1
-        return distribution
-    
-    def _get_vm_distribution_by_risk(self, vms: List[VMInfo]) -> Dict:
-        """Get VM distribution by risk level"""
-        distribution = {}
-        for vm in vms:
-            risk = vm.risk_level
-            distribution[risk] = distribution.get(risk, 0) + 1
-        return distribution
-    
-    def _get_vm_distribution_by_environment(self, vms: List[VMInfo]) -> Dict:
-        """Get VM distribution by environment type"""
-        distribution = {}
-        for vm in vms:
-            env = vm.environment_type
-            distribution[env] = distribution.get(env, 0) + 1
-        return distribution
-    
-    def _get_vm_distribution_by_subscription(self, vms: List[VMInfo]) -> Dict:
-        """Get VM distribution by subscription (for multi-subscription mode)"""
-        distribution = {}
+    def _compute_distributions(self, vms: List[VMInfo], by_subscription: bool = False) -> Dict:
+        """Get VM distributions by provider, risk level, environment and (optionally) subscription in one pass"""
+        providers = {}
+        risks = {}
+        environments = {}
+        subscriptions = {}
+        
         for vm in vms:
-            subscription = getattr(vm, 'subscription_id', 'unknown')
-            distribution[subscription] = distribution.get(subscription, 0) + 1
-        return distribution
+            provider = vm.cloud_provider
+            providers[provider] = providers.get(provider, 0) + 1
+            risks[vm.risk_level] = risks.get(vm.risk_level, 0) + 1
+            environments[vm.environment_type] = environments.get(vm.environment_type, 0) + 1
+            if by_subscription:
+                subscription = vm.subscription_id
+                subscriptions[subscription] = subscriptions.get(subscription, 0) + 1
+        
+        return {
+            'by_provider': providers,
+            'by_risk_level': risks,
+            'by_environment': environments,
+            'by_subscription': subscriptions if by_subscription else None
+        }
     
     def _generate_risk_summary(self, vms: List[VMInfo], risk_assessments: Dict) -> Dict:
         """Generate risk level summary with recommendations"""
-        risk_summary = {}
-        
-        for vm in vms:
-            risk_level = vm.risk_level
-            if risk_level not in risk_summary:
-                risk_summary[risk_level] = {
-                    'count': 0,
-                    'savings': 0,
-                    'recommendation': ''
-                }
-            
-            risk_summary[risk_level]['count'] += 1
-            risk_summary[risk_level]['savings'] += vm.potential_savings
+        risk_summary = {
+            risk_level: {**totals, 'recommendation': ''}
+            for risk_level, totals in self._risk_breakdown(vms).items()
+        }
         
         # Add recommendations
         risk_summary.get('very_low', {})['recommendation'] = 'Immediate conversion recommended'
@@ -1848,31 +2634,30 @@ class BYOLConverter:
         
         for vm in vms:
             if vm.current_license_type == LicenseType.ON_DEMAND:
-                if vm.risk_level in ['very_low', 'low']:
-                    timeline['phase_1_immediate'].append(vm.vm_id)
-                elif vm.risk_level == 'medium':
-                    timeline['phase_2_short_term'].append(vm.vm_id)
-                elif vm.risk_level == 'high':
-                    timeline['phase_3_medium_term'].append(vm.vm_id)
-                else:  # critical
-                    timeline['phase_4_long_term'].append(vm.vm_id)
+                # Critical and unrecognized risk levels go to the long-term phase
+                timeline[_RISK_TO_PHASE.get(vm.risk_level, 'phase_4_long_term')].append(vm.vm_id)
         
         return timeline
     
-    def discover_inventory(self) -> List[VMInfo]:
-        """Step 1: Discover current VM inventory and generate comprehensive reports"""
+    def discover_inventory(self, generate_reports: bool = False) -> List[VMInfo]:
+        """Step 1: Discover current VM inventory
+        
+        Only the JSON inventory is written by default; pass generate_reports=True to
+        run the comprehensive analysis and write its reports as well.
+        """
         logger.info("Starting VM inventory discovery...")
         
-        # Run comprehensive analysis asynchronously
-        try:
-            import asyncio
-            # Run the comprehensive analysis
-            analysis_results = asyncio.run(self.run_comprehensive_analysis())
-            vms = self._extract_vms_from_analysis(analysis_results)
-        except Exception as e:
-            logger.warning(f"Could not run comprehensive analysis: {e}. Falling back to basic inventory.")
-            # Fallback to basic discovery
-            vms = self.vm_manager.discover_vms()
+        if generate_reports:
+            # Run comprehensive analysis asynchronously
+            try:
+                analysis_results = asyncio.run(self.run_comprehensive_analysis())
+                vms = self._extract_vms_from_analysis(analysis_results)
+            except Exception as e:
+                logger.warning(f"Could not run comprehensive analysis: {e}. Falling back to basic inventory.")
+                # Fallback to basic discovery
+                vms = self._get_vms()
+        else:
+            vms = self._get_vms()
         
         # Save inventory to file
         self.save_inventory_report(vms, "vm_inventory.json")
@@ -1880,55 +2665,109 @@ class BYOLConverter:
 
     def _extract_vms_from_analysis(self, analysis_results: Dict) -> List[VMInfo]:
         """Extract VMs list from comprehensive analysis results"""
-        # The VMs are stored in the vm_manager after analysis
-        if self.multi_subscription_mode and hasattr(self.vm_manager, 'get_consolidated_vm_list'):
-            return self.vm_manager.get_consolidated_vm_list()
+        # The analysis discovered through _get_vms, so this is a cache hit
+        return self._get_vms()
+    
+    def _get_vms(self, max_age: float = 300) -> List[VMInfo]:
+        """Return the discovered VM inventory, re-discovering once it is older than max_age seconds"""
+        now = time.monotonic()
+        if self._discovery_cache is not None and now - self._discovery_ts < max_age:
+            return self._discovery_cache
+        
+        if isinstance(self.vm_manager, MultiSubscriptionAzureManager):
+            vms = self.vm_manager.get_consolidated_vm_list()
+        elif isinstance(self.vm_manager, MultiCloudVMManager):
+            vms = [vm for provider_vms in self.vm_manager.discover_all_vms().values() for vm in provider_vms]
         else:
-            return self.vm_manager.discover_vms()
+            vms = self.vm_manager.discover_vms()
+        
+        self._discovery_cache = vms
+        self._discovery_ts = now
+        return vms
+    
+    def invalidate_vm_cache(self):
+        """Force the next _get_vms call to query the cloud provider"""
+        self._discovery_cache = None
+        # License types may have changed in place, so drop the derived columns too
+        self._columns_source = None
+    
+    def vms_by_subscription(self) -> Dict[str, List[VMInfo]]:
+        """Group the cached inventory by subscription, in the manager's subscription order"""
+        grouped = {sub_id: [] for sub_id in getattr(self.vm_manager, 'managers', {})}
+        for vm in self._get_vms():
+            grouped.setdefault(vm.subscription_id, []).append(vm)
+        return grouped
     
     def analyze_licensing_requirements(self, vms: List[VMInfo]) -> Dict:
         """Analyze current licensing and requirements"""
-        analysis = {
+        current, byol, savings, license_codes = self._inventory_columns(vms)
+        current_cost, byol_cost, total_savings, on_demand_count, byol_count = _aggregate_cost_columns(
+            current, byol, savings, license_codes
+        )
+        license_requirements = {}
+        
+        # License requirements by edition for on-demand VMs; the edition rule is
+        # the same for every provider, so it is resolved once outside the loop
+        on_demand_code = _LICENSE_CODES[LicenseType.ON_DEMAND]
+        edition_of = self._determine_windows_edition
+        for i in np.flatnonzero(license_codes == on_demand_code).tolist():
+            vm = vms[i]
+            edition = edition_of(vm.os_version)
+            requirement = license_requirements.get(edition)
+            if requirement is None:
+                requirement = license_requirements[edition] = {'count': 0, 'cores': 0}
+            requirement['count'] += 1
+            requirement['cores'] += vm.cores
+        
+        return {
             'total_vms': len(vms),
-            'on_demand_vms': len([vm for vm in vms if vm.current_license_type == LicenseType.ON_DEMAND]),
-            'byol_vms': len([vm for vm in vms if vm.current_license_type == LicenseType.BYOL]),
-            'total_current_cost': sum(vm.monthly_cost_current for vm in vms),
-            'total_potential_byol_cost': sum(vm.estimated_monthly_cost_byol for vm in vms),
-            'total_potential_savings': sum(vm.potential_savings for vm in vms),
-            'license_requirements': {},
-            'available_licenses': len([l for l in self.license_manager.licenses if not l.in_use])
+            'on_demand_vms': on_demand_count,
+            'byol_vms': byol_count,
+            'total_current_cost': current_cost,
+            'total_potential_byol_cost': byol_cost,
+            'total_potential_savings': total_savings,
+            'license_requirements': license_requirements,
+            'available_licenses': sum(1 for l in self.license_manager.licenses if not l.in_use)
         }
-        
-        # Calculate license requirements by edition
-        for vm in vms:
-            if vm.current_license_type == LicenseType.ON_DEMAND:
-                edition = self._determine_windows_edition(vm.os_version)
-                if edition not in analysis['license_requirements']:
-                    analysis['license_requirements'][edition] = {'count': 0, 'cores': 0}
-                analysis['license_requirements'][edition]['count'] += 1
-                analysis['license_requirements'][edition]['cores'] += vm.cores
-        
-        return analysis
+    
+    def _risk_breakdown(self, vms: List[VMInfo]) -> Dict:
+        """VM count and monthly savings per risk level, in first-seen order"""
+        savings = self._inventory_columns(vms)[2]
+        levels = {}
+        codes = np.fromiter((levels.setdefault(vm.risk_level, len(levels)) for vm in vms),
+                            dtype=np.int64, count=len(vms))
+        counts = np.bincount(codes, minlength=len(levels)).tolist()
+        totals = np.bincount(codes, weights=savings, minlength=len(levels)).tolist()
+        return {level: {'count': count, 'savings': total}
+                for level, count, total in zip(levels, counts, totals)}
+    
+    def _inventory_columns(self, vms: List[VMInfo]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(current cost, BYOL cost, savings, license code) columns for an inventory
+        
+        Columns are kept for the last list seen so the analysis steps over one
+        discovered inventory share a single materialization.
+        """
+        if vms is not self._columns_source or len(vms) != len(self._savings):
+            self._cost_current, self._cost_byol, self._savings = _vm_cost_columns(vms)
+            self._license_codes = np.fromiter((_LICENSE_CODES[vm.current_license_type] for vm in vms),
+                                              dtype=np.int8, count=len(vms))
+            self._columns_source = vms
+        return self._cost_current, self._cost_byol, self._savings, self._license_codes
     
     def _determine_windows_edition(self, os_version: str) -> str:
         """Determine Windows edition from OS version"""
-        if 'datacenter' in os_version.lower():
-            return 'Datacenter'
-        else:
-            return 'Standard'
+        return _windows_edition(os_version)
     
     def identify_test_candidates(self, vms: List[VMInfo]) -> List[VMInfo]:
         """Step 2: Identify test candidates for conversion"""
-        candidates = []
-        
-        for vm in vms:
-            if (vm.current_license_type == LicenseType.ON_DEMAND and 
-                vm.risk_level == 'low' and
-                vm.potential_savings > 0):
-                candidates.append(vm)
+        # Read straight from the VMs: candidates go on to live test conversions
+        candidates = [
+            vm for vm in vms
+            if vm.current_license_type == LicenseType.ON_DEMAND and vm.risk_level == 'low' and vm.potential_savings > 0
+        ]
         
-        # Sort by potential savings (highest first)
-        candidates.sort(key=lambda x: x.potential_savings, reverse=True)
+        # Sort by potential savings (highest first); stable, so ties keep inventory order
+        candidates.sort(key=lambda vm: vm.potential_savings, reverse=True)
         
         logger.info(f"Identified {len(candidates)} test candidates")
         return candidates[:5]  # Return top 5 candidates
@@ -2008,15 +2847,21 @@ class BYOLConverter:
             # Release license on error
             self.license_manager.release_license(vm.vm_id)
         
-        self.conversion_log.append(result)
+        self._record_conversion(result)
         return result
     
-    def _simulate_conversion(self, vm: VMInfo, test_mode: bool = False) -> Dict:
-        """Simulate VM conversion for dry run mode"""
+    def _simulate_conversion(self, vm: VMInfo, test_mode: bool = False,
+                             license_lookup: Optional[Dict] = None,
+                             conversion_time: Optional[str] = None) -> Dict:
+        """Simulate VM conversion for dry run mode
+        
+        license_lookup, when given, memoizes available licenses per (edition, cores)
+        across calls; conversion_time lets a batch share one timestamp.
+        """
         result = {
             'vm_id': vm.vm_id,
             'vm_name': vm.name,
-            'conversion_time': datetime.datetime.now().isoformat(),
+            'conversion_time': conversion_time or datetime.datetime.now().isoformat(),
             'success': True,  # Assume success in simulation
             'error': None,
             'snapshot_id': f"snapshot-{vm.name}-simulated" if not test_mode else None,
@@ -2028,19 +2873,22 @@ class BYOLConverter:
         
         # Simulate license check
         edition = self._determine_windows_edition(vm.os_version)
-        available_licenses = self.license_manager.get_available_licenses(edition, vm.cores)
+        if license_lookup is None:
+            available_licenses = self.license_manager.get_available_licenses(edition, vm.cores)
+        else:
+            available_licenses = license_lookup.get((edition, vm.cores))
+            if available_licenses is None:
+                available_licenses = license_lookup[(edition, vm.cores)] = \
+                    self.license_manager.get_available_licenses(edition, vm.cores)
         
         if available_licenses:
             result['license_allocated'] = f"SIMULATED-{available_licenses[0].license_key}"
             result['simulation_details']['license_check'] = f"✅ Found available {edition} license for {vm.cores} cores"
             
-            # Simulate conversion steps
-            result['simulation_details']['steps_simulated'] = [
-                "✅ License availability verified",
-                "✅ Snapshot creation would succeed" if not test_mode else "⏭️ Snapshot skipped (test mode)",
-                "✅ VM conversion to BYOL would succeed",
-                "✅ License allocation would complete"
-            ]
+            # Simulate conversion steps (shared, immutable)
+            result['simulation_details']['steps_simulated'] = (
+                self._SIM_STEPS_TEST_MODE if test_mode else self._SIM_STEPS
+            )
             
             logger.info(f"🔍 DRY RUN: VM {vm.name} conversion simulation successful")
             logger.info(f"🔍 DRY RUN: Would allocate license {available_licenses[0].license_key}")
@@ -2052,33 +2900,40 @@ class BYOLConverter:
             result['simulation_details']['license_check'] = f"❌ No available {edition} license for {vm.cores} cores"
             logger.warning(f"🔍 DRY RUN: VM {vm.name} conversion would fail - insufficient licenses")
         
-        self.conversion_log.append(result)
+        self._record_conversion(result)
         return result
     
-    def batch_convert_vms(self, vms: List[VMInfo]) -> List[Dict]:
-        """Convert multiple VMs to BYOL"""
-        results = []
+    def batch_convert_vms(self, vms: List[VMInfo], max_workers: Optional[int] = None) -> List[Dict]:
+        """Convert multiple VMs to BYOL
+        
+        Live conversions are I/O-bound SDK calls, so they run on a thread pool;
+        results keep the order of the eligible VMs.
+        """
+        # Read license types from the VMs themselves: a cached column could be stale and
+        # this list decides which VMs receive live license changes
+        eligible = [vm for vm in vms if vm.current_license_type == LicenseType.ON_DEMAND]
         
         if self.dry_run:
             logger.info("🔍 DRY RUN: Simulating batch VM conversions...")
-            for vm in vms:
-                if vm.current_license_type == LicenseType.ON_DEMAND:
-                    result = self._simulate_conversion(vm, test_mode=False)
-                    results.append(result)
-            return results
+            # Simulations never allocate, so availability per (edition, cores) holds for the
+            # whole batch, and the batch shares one simulated conversion time
+            license_lookup = {}
+            batch_time = datetime.datetime.now().isoformat()
+            return [self._simulate_conversion(vm, test_mode=False, license_lookup=license_lookup,
+                                              conversion_time=batch_time)
+                    for vm in eligible]
         
-        for vm in vms:
-            if vm.current_license_type == LicenseType.ON_DEMAND:
-                result = self._convert_single_vm(vm, test_mode=False)
-                results.append(result)
+        if not eligible:
+            return []
         
-        return results
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(eligible))) as executor:
+            return list(executor.map(self._convert_single_vm, eligible))
     
     def generate_cost_analysis_report(self, vms: List[VMInfo], analysis: Dict) -> str:
         """Generate detailed cost analysis report"""
         dry_run_notice = "\n⚠️  DRY RUN MODE - This is a simulation report ⚠️\n" if self.dry_run else ""
         
-        report = f"""
+        parts = [f"""
 # Windows VM BYOL Conversion Analysis Report{dry_run_notice}
 Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 Mode: {'🔍 DRY RUN (Simulation)' if self.dry_run else '🚀 LIVE MODE'}
@@ -2092,79 +2947,119 @@ Mode: {'🔍 DRY RUN (Simulation)' if self.dry_run else '🚀 LIVE MODE'}
 - **Annual Savings Potential: ${analysis['total_potential_savings'] * 12:,.2f}**
 
 ## License Requirements
-"""
-        
-        for edition, req in analysis['license_requirements'].items():
-            report += f"- {edition}: {req['count']} VMs, {req['cores']} cores total\n"
+"""]
         
-        report += f"\n## Available Licenses: {analysis['available_licenses']}\n\n"
+        # Collect the pieces and join once instead of growing one string
+        parts.extend(f"- {edition}: {req['count']} VMs, {req['cores']} cores total\n"
+                     for edition, req in analysis['license_requirements'].items())
         
-        # VM breakdown by risk level
-        risk_breakdown = {}
-        for vm in vms:
-            if vm.risk_level not in risk_breakdown:
-                risk_breakdown[vm.risk_level] = {'count': 0, 'savings': 0}
-            risk_breakdown[vm.risk_level]['count'] += 1
-            risk_breakdown[vm.risk_level]['savings'] += vm.potential_savings
+        parts.append(f"\n## Available Licenses: {analysis['available_licenses']}\n\n")
         
-        report += "## Risk Level Breakdown\n"
-        for risk, data in risk_breakdown.items():
-            report += f"- {risk.capitalize()} Risk: {data['count']} VMs, ${data['savings']:,.2f} potential monthly savings\n"
+        parts.append("## Risk Level Breakdown\n")
+        parts.extend(f"- {risk.capitalize()} Risk: {data['count']} VMs, ${data['savings']:,.2f} potential monthly savings\n"
+                     for risk, data in self._risk_breakdown(vms).items())
         
-        return report
+        return ''.join(parts)
     
     def save_inventory_report(self, vms: List[VMInfo], filename: str):
         """Save VM inventory to file"""
         try:
-            with open(filename, 'w') as f:
-                json.dump([asdict(vm) for vm in vms], f, indent=2, default=str)
+            # orjson encodes the dataclasses directly, without asdict() copies
+            with open(filename, 'wb') as f:
+                f.write(_json_bytes(vms, indent=True))
             logger.info(f"Saved inventory report to {filename}")
         except Exception as e:
             logger.error(f"Error saving inventory report: {e}")
     
+    def _record_conversion(self, result: Dict):
+        """Append one conversion result to the NDJSON log; safe to call from worker threads"""
+        line = _json_bytes(result) + b'\n'
+        with self._conversion_log_lock:
+            if self._conversion_log_fp is None:
+                # Start the file on the first record; append if it was reopened after close()
+                recorded = self._conversion_counts['success'] + self._conversion_counts['fail']
+                self._conversion_log_fp = open(self.conversion_log_path, 'ab' if recorded else 'wb')
+                # Closes the file at exit or when the converter is collected, without keeping it alive
+                self._conversion_log_finalizer = weakref.finalize(self, self._conversion_log_fp.close)
+            self._conversion_log_fp.write(line)
+            self._conversion_counts['success' if result.get('success', False) else 'fail'] += 1
+    
+    def close(self):
+        """Close the conversion log file; recording again reopens it for appending"""
+        with self._conversion_log_lock:
+            if self._conversion_log_fp is not None:
+                self._conversion_log_finalizer()
+                self._conversion_log_fp = None
+                self._conversion_log_finalizer = None
+    
+    def _flush_conversion_log(self) -> bool:
+        """Flush pending records to disk; False when nothing has been recorded"""
+        with self._conversion_log_lock:
+            if self._conversion_log_fp is not None:
+                self._conversion_log_fp.flush()
+            return bool(self._conversion_counts['success'] + self._conversion_counts['fail'])
+    
+    def _iter_conversion_log(self):
+        """Yield the recorded conversion results in order, read back from the NDJSON log"""
+        if not self._flush_conversion_log():
+            return
+        with open(self.conversion_log_path, 'rb') as f:
+            for line in f:
+                yield orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+    
     def save_conversion_log(self, filename: str = None):
-        """Save conversion log to file"""
-        if not filename:
-            mode_prefix = "dryrun_" if self.dry_run else "live_"
-            filename = f"{mode_prefix}conversion_log_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        """Flush the streamed conversion log; with filename, also export it as a JSON array"""
+        if not self._flush_conversion_log():
+            logger.info("No conversions recorded; nothing to save")
+            return
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.conversion_log, f, indent=2)
-            logger.info(f"Saved conversion log to {filename}")
+            if filename:
+                with open(filename, 'wb') as f:
+                    f.write(b'[')
+                    for i, result in enumerate(self._iter_conversion_log()):
+                        f.write(b',\n' if i else b'\n')
+                        f.write(_json_bytes(result, indent=True))
+                    f.write(b'\n]')
+            logger.info(f"Saved conversion log to {filename or self.conversion_log_path}")
         except Exception as e:
             logger.error(f"Error saving conversion log: {e}")
     
     def generate_dry_run_summary(self) -> str:
         """Generate a summary of dry run results"""
-        if not self.dry_run or not self.conversion_log:
+        total = self._conversion_counts['success'] + self._conversion_counts['fail']
+        if not self.dry_run or not total:
             return ""
         
-        successful_sims = [log for log in self.conversion_log if log.get('success', False)]
-        failed_sims = [log for log in self.conversion_log if not log.get('success', False)]
-        
-        summary = f"""
+        # Successes stream straight into the buffer after the header; failures are held
+        # back for their own section, so the log is still read only once
+        buf = io.StringIO()
+        w = buf.write
+        w(f"""
 🔍 DRY RUN SUMMARY
 ==================
-Total Simulations: {len(self.conversion_log)}
-✅ Would Succeed: {len(successful_sims)}
-❌ Would Fail: {len(failed_sims)}
+Total Simulations: {total}
+✅ Would Succeed: {self._conversion_counts['success']}
+❌ Would Fail: {self._conversion_counts['fail']}
 
 SUCCESSFUL CONVERSIONS WOULD INCLUDE:
-"""
+""")
         
-        for sim in successful_sims:
-            summary += f"  - {sim['vm_name']}: License {sim.get('license_allocated', 'N/A')}\n"
+        failed = io.StringIO()
+        for sim in self._iter_conversion_log():
+            if sim.get('success', False):
+                w(f"  - {sim['vm_name']}: License {sim.get('license_allocated', 'N/A')}\n")
+            else:
+                failed.write(f"  - {sim['vm_name']}: {sim.get('error', 'Unknown error')}\n")
         
-        if failed_sims:
-            summary += "\nFAILED CONVERSIONS:\n"
-            for sim in failed_sims:
-                summary += f"  - {sim['vm_name']}: {sim.get('error', 'Unknown error')}\n"
+        if failed.tell():
+            w("\nFAILED CONVERSIONS:\n")
+            w(failed.getvalue())
         
-        summary += f"\n💰 No actual costs incurred - this was a simulation\n"
-        summary += f"🚀 Run without --dry-run to execute actual conversions\n"
+        w("\n💰 No actual costs incurred - this was a simulation\n")
+        w("🚀 Run without --dry-run to execute actual conversions\n")
         
-        return summary
+        return buf.getvalue()
 
 def main():
     """Main execution function with multi-subscription support"""
@@ -2202,12 +3097,9 @@ def main():
         # Read from file
         try:
             with open(args.subscription_file, 'r') as f:
-                subscription_ids = []
-                for line in f:
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if line and not line.startswith('#'):
-                        subscription_ids.append(line)
+                lines = map(str.strip, f.read().splitlines())
+            # Skip empty lines and comments
+            subscription_ids = [line for line in lines if line and not line.startswith('#')]
             print(f"📂 Loaded {len(subscription_ids)} subscription IDs from {args.subscription_file}")
         except Exception as e:
             print(f"❌ Error reading subscription file: {e}")
@@ -2227,6 +3119,18 @@ def main():
         print("🔍 Auto-discovery mode: Scanning all accessible Azure subscriptions...")
         print("💡 Use --no-auto-discover to disable auto-discovery")
     
+    # Resolve subscription wording and report prefix once for all prompts below
+    multi_subscription = auto_discovery_mode or bool(subscription_ids and len(subscription_ids) > 1)
+    if auto_discovery_mode:
+        subscription_text = "all discovered subscriptions"
+        multi_sub_prefix = "auto_discovery_"
+    elif subscription_ids:
+        subscription_text = f"{len(subscription_ids)} subscription(s)"
+        multi_sub_prefix = f"multi_sub_{len(subscription_ids)}_" if multi_subscription else ""
+    else:
+        subscription_text = "subscription"
+        multi_sub_prefix = ""
+    
     try:
         # Initialize converter with auto-discovery or specified subscriptions
         if auto_discovery_mode:
@@ -2254,21 +3158,24 @@ def main():
                 output_dir=args.output_dir
             )
         
+        # Only the multi-subscription manager can break results down per subscription
+        has_sub_summary = callable(getattr(converter.vm_manager, 'get_subscription_summary', None))
+        
         # Step 1: Discover inventory
         mode_text = "🔍 DRY RUN MODE: Discovering" if args.dry_run else "Discovering"
         if auto_discovery_mode:
             print(f"Step 1: {mode_text} VM inventory across all accessible subscriptions...")
         else:
             print(f"Step 1: {mode_text} VM inventory across {len(subscription_ids)} subscription(s)...")
-        vms = converter.discover_inventory()
+        vms = converter.discover_inventory(generate_reports=True)
         
         if not vms:
             print("No VMs found. Exiting.")
             return
         
         # Show subscription breakdown if multi-subscription
-        if ((not auto_discovery_mode and len(subscription_ids) > 1) or auto_discovery_mode) and hasattr(converter.vm_manager, 'get_subscription_summary'):
-            sub_summary = converter.vm_manager.get_subscription_summary()
+        if multi_subscription and has_sub_summary:
+            sub_summary = converter.vm_manager.get_subscription_summary(converter.vms_by_subscription())
             print("\n📊 Subscription Breakdown:")
             for sub_id, details in sub_summary['subscription_details'].items():
                 print(f"  🔹 {sub_id}: {details['vm_count']} VMs, ${details['potential_monthly_savings']:,.2f} potential savings")
@@ -2283,13 +3190,7 @@ def main():
         
         # Save detailed report
         report_prefix = "dryrun_" if args.dry_run else ""
-        if auto_discovery_mode:
-            multi_sub_prefix = "auto_discovery_"
-        elif subscription_ids and len(subscription_ids) > 1:
-            multi_sub_prefix = f"multi_sub_{len(subscription_ids)}_"
-        else:
-            multi_sub_prefix = ""
-        report_filename = f"{report_prefix}{multi_sub_prefix}cost_analysis_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        report_filename = f"{report_prefix}{multi_sub_prefix}cost_analysis_{converter.run_timestamp.strftime('%Y%m%d_%H%M%S')}.md"
         with open(report_filename, 'w') as f:
             f.write(report)
         print(f"📄 Detailed report saved to: {report_filename}")
@@ -2302,18 +3203,10 @@ def main():
             print(f"Found {len(test_candidates)} test candidates:")
             for vm in test_candidates:
                 # Show subscription info if multiple subscriptions (auto-discovery or manual multi-sub)
-                show_sub_info = auto_discovery_mode or (subscription_ids and len(subscription_ids) > 1)
-                sub_info = f" (Sub: {getattr(vm, 'subscription_id', 'unknown')})" if show_sub_info else ""
+                sub_info = f" (Sub: {vm.subscription_id})" if multi_subscription else ""
                 print(f"  - {vm.name}{sub_info}: ${vm.potential_savings:.2f} monthly savings")
             
             # Different prompts for dry run vs live mode
-            if auto_discovery_mode:
-                subscription_text = "all discovered subscriptions"
-            elif subscription_ids:
-                subscription_text = f"{len(subscription_ids)} subscription(s)"
-            else:
-                subscription_text = "subscription"
-                
             if args.dry_run:
                 confirm = input(f"\nProceed with test conversion simulation across {subscription_text}? (y/n): ")
                 action_text = "simulating test conversions"
@@ -2326,8 +3219,9 @@ def main():
                 test_results = converter.run_test_conversion(test_candidates)
                 
                 # Display results
-                successful = [r for r in test_results if r['success']]
-                failed = [r for r in test_results if not r['success']]
+                successful, failed = [], []
+                for result in test_results:
+                    (successful if result['success'] else failed).append(result)
                 
                 result_text = "simulations" if args.dry_run else "conversions"
                 print(f"\nTest Results: {len(successful)} successful {result_text}, {len(failed)} failed")
@@ -2346,58 +3240,41 @@ def main():
                 # Multi-subscription batch mode option
                 if args.batch_mode and successful:
                     if args.dry_run:
-                        if auto_discovery_mode:
-                            subscription_text = "all discovered subscriptions"
-                        elif subscription_ids:
-                            subscription_text = f"{len(subscription_ids)} subscription(s)"
-                        else:
-                            subscription_text = "subscription"
                         print(f"\n🔍 DRY RUN: Simulating batch conversion across {subscription_text}...")
                         batch_results = converter.batch_convert_vms(vms)
-                        batch_successful = [r for r in batch_results if r['success']]
-                        print(f"Batch simulation: {len(batch_successful)}/{len(batch_results)} would succeed across all subscriptions")
+                        batch_successful = sum(1 for r in batch_results if r['success'])
+                        print(f"Batch simulation: {batch_successful}/{len(batch_results)} would succeed across all subscriptions")
                         dry_run_summary = converter.generate_dry_run_summary()
                         print(dry_run_summary)
                     else:
                         total_eligible = sum(1 for vm in vms if vm.current_license_type == LicenseType.ON_DEMAND)
-                        if auto_discovery_mode:
-                            subscription_text = "all discovered subscriptions"
-                        elif subscription_ids:
-                            subscription_text = f"{len(subscription_ids)} subscription(s)"
-                        else:
-                            subscription_text = "subscription"
                         batch_confirm = input(f"\n⚠️  Run batch conversion on ALL eligible VMs across {subscription_text}? This will affect {total_eligible} VMs! (y/n): ")
                         if batch_confirm.lower() == 'y':
                             print("Running multi-subscription batch conversion...")
                             batch_results = converter.batch_convert_vms(vms)
-                            batch_successful = [r for r in batch_results if r['success']]
-                            print(f"Batch conversion completed: {len(batch_successful)}/{len(batch_results)} successful across all subscriptions")
+                            batch_successful = sum(1 for r in batch_results if r['success'])
+                            print(f"Batch conversion completed: {batch_successful}/{len(batch_results)} successful across all subscriptions")
         
         # Save conversion log
         converter.save_conversion_log()
+        converter.close()
         
         completion_text = "simulation" if args.dry_run else "conversion process"
-        if auto_discovery_mode:
-            subscription_text = " across all discovered subscriptions"
-        elif subscription_ids and len(subscription_ids) > 1:
-            subscription_text = f" across {len(subscription_ids)} subscription(s)"
-        else:
-            subscription_text = ""
-        print(f"\n{completion_text.capitalize()}{subscription_text} completed. Check logs for details.")
+        completion_scope = f" across {subscription_text}" if multi_subscription else ""
+        print(f"\n{completion_text.capitalize()}{completion_scope} completed. Check logs for details.")
         
         if args.dry_run:
             print("\n🚀 To execute actual conversions, run the script without --dry-run flag")
         
         # Show final subscription summary for multi-subscription runs
-        show_summary = auto_discovery_mode or (subscription_ids and len(subscription_ids) > 1)
-        if show_summary:
+        if multi_subscription:
             if auto_discovery_mode:
                 print(f"\n📊 Final Summary Across All Discovered Subscriptions:")
             else:
                 print(f"\n📊 Final Summary Across {len(subscription_ids)} Subscriptions:")
             print(f"  📈 Total VMs Analyzed: {len(vms)}")
-            if hasattr(converter.vm_manager, 'get_subscription_summary'):
-                sub_summary = converter.vm_manager.get_subscription_summary()
+            if has_sub_summary:
+                sub_summary = converter.vm_manager.get_subscription_summary(converter.vms_by_subscription())
                 print(f"  💰 Total Potential Monthly Savings: ${sub_summary['grand_totals']['total_potential_savings']:,.2f}")
                 print(f"  📅 Total Potential Annual Savings: ${sub_summary['grand_totals']['total_potential_savings'] * 12:,.2f}")
         